@@ -0,0 +1,204 @@
+"""
+Benchmarks de los dos motores de escalas:
+  - holygrail.greedy         (HolyGrail4.5: enarmonización voraz con select_enharmonic)
+  - holygrail.key_signature  (HolyHarmonyGrail1: enarmonización aritmética por grado, holygrail.speller)
+
+Para cada carga de trabajo se mide rendimiento (ops/s), latencia p50/p99,
+bloques de memoria netos y pico de memoria (tracemalloc).
+
+Uso:
+  python HolyGrailBench.py                    # compara con bench_baseline.json
+  python HolyGrailBench.py --save-baseline    # guarda los resultados como nueva línea base
+  python HolyGrailBench.py --tolerance 0.10   # falla si algo pierde más del 10 %
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from holygrail import get_engine
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(HERE, "bench_baseline.json")
+
+MODES = ["Ionian", "Dorian", "Phrygian", "Lydian", "Mixolydian", "Aeolian", "Locrian"]
+VARIATIONS = ["sus4", "7(b9,b13)", "7(b9,#9,b13)", "7b5(b9,#9,b13)", "7(b9,#9,#11,13)"]
+ROOTS = ["C", "G", "D", "A", "E", "B", "F#", "C#", "F", "Bb", "Eb", "Ab", "Db", "Gb", "Cb"]
+
+
+def make_queries(count, seed=1234):
+    rng = random.Random(seed)
+    return [(rng.choice(ROOTS), rng.choice(MODES)) for _ in range(count)]
+
+
+# ---------------------------------------------
+# CARGAS DE TRABAJO
+# ---------------------------------------------
+# Cada carga devuelve una lista de funciones sin argumentos (una por operación).
+def workload_single_cold(engine, queries):
+    # Construcción completa de la escala, sin pasar por el catálogo
+    return [lambda r=r, m=m: engine._build_major_scale(r, m, None) for r, m in queries]
+
+
+def workload_single_warm(engine, queries):
+    for r, m in queries:
+        engine.calculate_major_scale(r, m)
+    return [lambda r=r, m=m: engine.calculate_major_scale(r, m) for r, m in queries]
+
+
+def workload_variations(engine, queries):
+    return [
+        lambda r=r, v=VARIATIONS[i % len(VARIATIONS)]: engine._build_major_scale(r, "Mixolydian", v)
+        for i, (r, _) in enumerate(queries)
+    ]
+
+
+def workload_degree_table(engine, queries):
+    if hasattr(engine, "calculate_modes_for_degrees"):
+        return [lambda r=r, m=m: engine.calculate_modes_for_degrees(r, m) for r, m in queries]
+    return [lambda r=r: engine.calculate_modes_for_degree(r) for r, _ in queries]
+
+
+def workload_batch(engine, queries, batch_size=1000):
+    chunks = [queries[i:i + batch_size] for i in range(0, len(queries), batch_size)]
+    if hasattr(engine, "calculate_scales_batch"):
+        return [
+            lambda c=c: engine.calculate_scales_batch([r for r, _ in c], [m for _, m in c])
+            for c in chunks
+        ]
+    return [lambda c=c: [engine.calculate_major_scale(r, m) for r, m in c] for c in chunks]
+
+
+WORKLOADS = {
+    "single_cold": (workload_single_cold, 2000),
+    "single_warm": (workload_single_warm, 20000),
+    "variations": (workload_variations, 2000),
+    "degree_table": (workload_degree_table, 2000),
+    "batch": (workload_batch, 20000),
+}
+
+
+# ---------------------------------------------
+# MEDICIÓN
+# ---------------------------------------------
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure(operations):
+    # 1) Tiempos (sin tracemalloc, que ralentiza)
+    latencies = []
+    clock = time.perf_counter_ns
+    start = clock()
+    for op in operations:
+        t0 = clock()
+        op()
+        latencies.append(clock() - t0)
+    elapsed = (clock() - start) / 1e9
+    latencies.sort()
+
+    # 2) Memoria, en una segunda pasada
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    for op in operations:
+        op()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks_after = sys.getallocatedblocks()
+
+    return {
+        "ops": len(operations),
+        "ops_per_sec": len(operations) / elapsed if elapsed else float("inf"),
+        "p50_us": percentile(latencies, 0.50) / 1000,
+        "p99_us": percentile(latencies, 0.99) / 1000,
+        "net_blocks": blocks_after - blocks_before,
+        "peak_kib": peak / 1024,
+    }
+
+
+def run_benchmarks(selected=None):
+    engines = {
+        "HolyGrail4.5": get_engine("greedy"),
+        "HolyHarmonyGrail1": get_engine("key_signature"),
+    }
+    results = {}
+    for engine_name, engine in engines.items():
+        for workload_name, (build, count) in WORKLOADS.items():
+            if selected and workload_name not in selected:
+                continue
+            operations = build(engine, make_queries(count))
+            results[f"{engine_name}/{workload_name}"] = measure(operations)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Devuelve la lista de regresiones: rendimiento por debajo de (1 - tolerance)
+    veces la línea base, o p99 por encima de (1 + tolerance) veces.
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current["ops_per_sec"] < previous["ops_per_sec"] * (1 - tolerance):
+            regressions.append(f"{name}: {current['ops_per_sec']:.0f} ops/s (base {previous['ops_per_sec']:.0f})")
+        if current["p99_us"] > previous["p99_us"] * (1 + tolerance):
+            regressions.append(f"{name}: p99 {current['p99_us']:.1f} µs (base {previous['p99_us']:.1f})")
+    return regressions
+
+
+def format_table(results):
+    lines = [f"{'benchmark':<34}{'ops/s':>12}{'p50 µs':>10}{'p99 µs':>10}{'bloques':>10}{'pico KiB':>10}"]
+    for name, r in results.items():
+        lines.append(
+            f"{name:<34}{r['ops_per_sec']:>12.0f}{r['p50_us']:>10.2f}{r['p99_us']:>10.2f}"
+            f"{r['net_blocks']:>10}{r['peak_kib']:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de HolyGrail4.5 y HolyHarmonyGrail1.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="archivo JSON de la línea base")
+    parser.add_argument("--save-baseline", action="store_true", help="guarda los resultados como línea base")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="pérdida relativa tolerada (0.25 = 25 %%)")
+    parser.add_argument("--only", action="append", choices=sorted(WORKLOADS), help="ejecuta solo esta carga")
+    parser.add_argument("-o", "--output", help="guarda también los resultados en JSON")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.only)
+    print(format_table(results))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\nLínea base guardada en {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nSin línea base ({args.baseline}); usa --save-baseline para crearla.")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\nREGRESIONES DE RENDIMIENTO:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("\nSin regresiones respecto a la línea base.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+Genera el catálogo de referencia completo en paralelo:
+  - cada enarmonía de 'chromatic_scale' × modo × variación,
+  - la tabla de modos por grado (calculate_modes_for_degrees) de cada raíz y modo diatónico,
+  - los nombres de los intervalos y roles, en el idioma de --locale.
+
+El trabajo se reparte por raíz: cada raíz es un fragmento independiente y los
+fragmentos se escriben siempre en el orden de 'chromatic_scale', así que la
+salida es idéntica byte a byte con cualquier número de procesos.
+
+Formato: JSON por líneas, una línea por escala ("kind": "scale") o por tabla
+de grados ("kind": "degrees"), con las claves ordenadas.
+
+Uso:
+  python HolyGrailCatalog.py -o catalogo.jsonl                # un proceso por núcleo
+  python HolyGrailCatalog.py -o catalogo.jsonl --workers 1    # sin procesos auxiliares
+  python HolyGrailCatalog.py --definitions extra.json --digest
+  python HolyGrailCatalog.py --binary catalogo.bin            # formato binario para mmap
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from holygrail import DEFAULT_SPELLING, SPELLING_STRATEGIES, get_engine
+from holygrail.binary_catalog import write_binary_catalog
+from holygrail.mode_registry import mode_registry
+from holygrail.names import DEFAULT_LOCALE, available_locales
+
+
+def catalog_roots(spelling=DEFAULT_SPELLING):
+    """
+    Raíces del catálogo, en el orden fijo de los fragmentos.
+    """
+    return [root_note for names in get_engine(spelling).chromatic_scale for root_note in names]
+
+
+def _dump(entry):
+    return json.dumps(entry, ensure_ascii=False, sort_keys=True) + "\n"
+
+
+def render_shard(root_note, spelling=DEFAULT_SPELLING, locale=None):
+    """
+    Texto JSONL de todas las entradas de una raíz. Solo depende de sus
+    argumentos y del registro de modos, no del proceso que lo calcule.
+    """
+    engine = get_engine(spelling)
+    lines = []
+    for compiled in mode_registry:
+        result = engine.calculate_major_scale(root_note, compiled.mode, variation=compiled.variation)
+        lines.append(_dump({
+            "kind": "scale", "root": root_note, "mode": compiled.mode, "variation": compiled.variation,
+            **result.to_dict(locale),
+        }))
+
+    # Las tablas por grado solo existen en el motor por armadura
+    if hasattr(engine, "calculate_modes_for_degrees"):
+        for mode in engine.mode_to_major_offset:
+            modes = engine.calculate_modes_for_degrees(root_note, mode)
+            lines.append(_dump({
+                "kind": "degrees", "root": root_note, "mode": mode,
+                "degrees": [{"mode": name, **result.to_dict(locale)} for name, result in modes.items()],
+            }))
+    return "".join(lines)
+
+
+def _init_worker(definitions):
+    for path in definitions:
+        mode_registry.load(path)
+
+
+def generate_catalog(output, spelling=DEFAULT_SPELLING, workers=None, definitions=(), locale=None):
+    """
+    Escribe el catálogo en 'output' (archivo de texto) y devuelve su SHA-256.
+    'definitions' son archivos de modos adicionales que se cargan en cada proceso.
+    """
+    roots = catalog_roots(spelling)
+    digest = hashlib.sha256()
+
+    def write(text):
+        output.write(text)
+        digest.update(text.encode("utf-8"))
+
+    if workers == 1:
+        _init_worker(definitions)
+        for root_note in roots:
+            write(render_shard(root_note, spelling, locale))
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(list(definitions),)) as pool:
+            # map conserva el orden de 'roots' aunque los fragmentos terminen desordenados
+            for text in pool.map(render_shard, roots, [spelling] * len(roots), [locale] * len(roots)):
+                write(text)
+    return digest.hexdigest()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genera el catálogo completo de escalas en paralelo.")
+    parser.add_argument("-o", "--output", default="-", help="archivo JSONL de salida ('-' = stdout)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="número de procesos")
+    parser.add_argument("--spelling", default=DEFAULT_SPELLING, choices=sorted(SPELLING_STRATEGIES),
+                        help="estrategia de enarmonización")
+    parser.add_argument("--locale", default=DEFAULT_LOCALE, choices=available_locales(),
+                        help="idioma de intervalos y roles")
+    parser.add_argument("--definitions", action="append", default=[], help="archivo de modos adicional")
+    parser.add_argument("--digest", action="store_true", help="muestra el SHA-256 de la salida en stderr")
+    parser.add_argument("--binary", help="escribe solo el catálogo binario (holygrail.binary_catalog) en este archivo")
+    args = parser.parse_args(argv)
+
+    if args.binary:
+        _init_worker(args.definitions)
+        write_binary_catalog(args.binary, args.spelling)
+        return
+
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="\n")
+    try:
+        digest = generate_catalog(target, args.spelling, args.workers, args.definitions, args.locale)
+    finally:
+        if target is not sys.stdout:
+            target.close()
+    if args.digest:
+        print(f"sha256 {digest}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
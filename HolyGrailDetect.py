@@ -0,0 +1,78 @@
+"""
+Detección de tonalidad y modo sobre flujos de notas (holygrail.detection).
+
+Entradas:
+  - archivos .mid / .midi (Standard MIDI File, leídos localmente),
+  - archivos de texto o stdin con notas separadas por espacios o comas
+    ("C E G Bb", "C4 E4 G4", "60 64 67"); stdin se procesa línea a línea,
+    así que sirve para una interpretación en vivo.
+
+Salida: JSON por líneas. Por defecto una línea por nota con los mejores
+candidatos; con --summary, una sola línea por archivo con el resultado final.
+
+Uso:
+  python HolyGrailDetect.py tema.mid --summary
+  python HolyGrailDetect.py archivo_midi/*.mid --summary --window 64
+  echo "D F A C E G B" | python HolyGrailDetect.py --top 3
+"""
+import argparse
+import json
+import sys
+
+from holygrail.detection import DEFAULT_TONIC_WEIGHT, DEFAULT_WINDOW, KeyDetector, parse_note_tokens, read_midi_notes
+
+
+def _candidates(detections):
+    return [{"root": d.root, "mode": d.mode, "score": round(d.score, 4)} for d in detections]
+
+
+def iter_source_notes(source):
+    """
+    Notas de un archivo (MIDI o texto) o de '-' (stdin, línea a línea).
+    """
+    if source.lower().endswith((".mid", ".midi")):
+        yield from read_midi_notes(source)
+    elif source == "-":
+        for line in sys.stdin:
+            yield from parse_note_tokens(line)
+    else:
+        with open(source, encoding="utf-8") as f:
+            for line in f:
+                yield from parse_note_tokens(line)
+
+
+def detect(source, detector, top, summary, output):
+    detector.reset()
+    if summary:
+        count = 0
+        for _ in map(detector.push, iter_source_notes(source)):
+            count += 1
+        answer = {"source": source, "notes": count, "best": _candidates(detector.best(top))}
+        output.write(json.dumps(answer, ensure_ascii=False) + "\n")
+        return
+
+    for pc, best in detector.feed(iter_source_notes(source), top):
+        output.write(json.dumps({"pitch_class": pc, "best": _candidates(best)}, ensure_ascii=False) + "\n")
+        if source == "-":
+            output.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Detección continua de tonalidad y modo.")
+    parser.add_argument("sources", nargs="*", default=["-"], help="archivos .mid o de texto ('-' = stdin)")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="notas de la ventana deslizante")
+    parser.add_argument("--top", type=int, default=1, help="candidatos por respuesta")
+    parser.add_argument("--tonic-weight", type=float, default=DEFAULT_TONIC_WEIGHT, help="peso de la raíz")
+    parser.add_argument("--summary", action="store_true", help="solo el resultado final de cada fuente")
+    args = parser.parse_args(argv)
+
+    detector = KeyDetector(args.window, tonic_weight=args.tonic_weight)
+    for source in args.sources:
+        try:
+            detect(source, detector, args.top, args.summary, sys.stdout)
+        except (OSError, ValueError) as exc:
+            sys.stdout.write(json.dumps({"source": source, "error": str(exc)}, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Servidor local de consultas (asyncio) sobre un socket Unix o TCP.
+
+El protocolo es el de HolyGrailStream.py: JSON por líneas. Cada línea es una
+consulta (objeto JSON) o un lote (lista JSON de consultas), y se responde con
+una línea. Todas las conexiones comparten el mismo proceso y, por tanto, el
+mismo catálogo de escalas en memoria.
+
+  - Pipelining: el cliente puede enviar muchas consultas sin esperar; las
+    respuestas de cada conexión salen en el mismo orden que las consultas.
+  - Lotes: una lista de consultas viaja y se responde en una sola línea.
+  - Backpressure: si el cliente no lee sus respuestas, el servidor deja de
+    leer de esa conexión cuando el búfer de salida supera --high-water bytes.
+  - Las consultas sueltas se resuelven en el bucle de eventos (son
+    búsquedas en caché); los lotes y las líneas de más de INLINE_FRAME bytes
+    van a un hilo de trabajo, así un lote grande no detiene a las demás
+    conexiones.
+  - Al arrancar se precalculan el catálogo y la matriz de similitud (salvo
+    con --no-warm); --similarity-cache DIR la guarda y la lee en disco.
+
+Uso:
+  python HolyGrailServer.py --unix /tmp/holygrail.sock
+  python HolyGrailServer.py --host 127.0.0.1 --port 8765
+  printf '{"op": "role", "root": "G", "mode": "Mixolydian", "note": "C"}\\n' | nc -U /tmp/holygrail.sock
+"""
+import argparse
+import asyncio
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+
+from holygrail import build_scale_catalog, instrumentation, similarity_matrix
+from holygrail.similarity import USER_CACHE_DIR
+from HolyGrailStream import answer_line
+
+DEFAULT_MAX_FRAME = 1 << 20   # bytes máximos por línea (consulta o lote)
+DEFAULT_HIGH_WATER = 1 << 18  # bytes pendientes de envío antes de dejar de leer
+INLINE_FRAME = 1 << 12        # líneas más largas (o lotes) se resuelven en el hilo de trabajo
+
+
+async def handle_client(reader, writer, high_water=DEFAULT_HIGH_WATER, worker=None):
+    """
+    Atiende una conexión: lee líneas, responde en orden y espera (drain)
+    solo cuando el búfer de salida supera 'high_water'. Los lotes y las
+    líneas largas se resuelven en 'worker' (un executor; None = el por
+    defecto del bucle).
+    """
+    loop = asyncio.get_running_loop()
+    writer.transport.set_write_buffer_limits(high=high_water)
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                # Línea más larga que --max-frame: no se puede resincronizar
+                writer.write(b'{"error": "Consulta demasiado grande"}\n')
+                break
+            if not line:
+                break
+            if line.strip():
+                if len(line) > INLINE_FRAME or line.lstrip().startswith(b"["):
+                    answer = await loop.run_in_executor(worker, answer_line, line)
+                else:
+                    answer = answer_line(line)
+                writer.write(answer.encode("utf-8") + b"\n")
+                await writer.drain()
+        await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+def _remove_stale_socket(path):
+    try:
+        if stat.S_ISSOCK(os.stat(path).st_mode):
+            os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+async def serve(unix=None, host="127.0.0.1", port=8765, max_frame=DEFAULT_MAX_FRAME,
+                high_water=DEFAULT_HIGH_WATER, ready=None):
+    """
+    Arranca el servidor y atiende conexiones hasta que se cancele.
+    'ready', si se indica, es una función que recibe el servidor ya escuchando.
+    """
+    worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="holygrail")
+
+    def client_connected(reader, writer):
+        return handle_client(reader, writer, high_water, worker)
+
+    if unix:
+        _remove_stale_socket(unix)
+        server = await asyncio.start_unix_server(client_connected, unix, limit=max_frame)
+    else:
+        server = await asyncio.start_server(client_connected, host, port, limit=max_frame)
+    if ready is not None:
+        ready(server)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        worker.shutdown(wait=False, cancel_futures=True)
+        if unix:
+            _remove_stale_socket(unix)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servidor local de consultas de escalas (JSON por líneas).")
+    parser.add_argument("--unix", help="ruta del socket Unix (si no se indica, se usa TCP)")
+    parser.add_argument("--host", default="127.0.0.1", help="dirección TCP")
+    parser.add_argument("--port", type=int, default=8765, help="puerto TCP")
+    parser.add_argument("--max-frame", type=int, default=DEFAULT_MAX_FRAME, help="bytes máximos por línea")
+    parser.add_argument("--high-water", type=int, default=DEFAULT_HIGH_WATER,
+                        help="bytes pendientes de envío antes de aplicar backpressure")
+    parser.add_argument("--no-warm", action="store_true",
+                        help="no precalcula el catálogo ni la matriz de similitud al arrancar")
+    parser.add_argument("--similarity-cache", nargs="?", const=USER_CACHE_DIR, metavar="DIR",
+                        help=f"guarda y lee la matriz de similitud en DIR (por defecto {USER_CACHE_DIR})")
+    parser.add_argument("--instrument", action="store_true",
+                        help="mide llamadas y tiempos (consulta {\"op\": \"stats\"})")
+    args = parser.parse_args(argv)
+
+    if args.instrument:
+        instrumentation.enable()
+
+    if not args.no_warm:
+        build_scale_catalog()
+    if not args.no_warm or args.similarity_cache:
+        similarity_matrix(args.similarity_cache)
+
+    def ready(server):
+        where = args.unix or f"{args.host}:{args.port}"
+        print(f"Escuchando en {where}", flush=True)
+
+    try:
+        asyncio.run(serve(args.unix, args.host, args.port, args.max_frame, args.high_water, ready))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
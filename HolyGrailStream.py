@@ -0,0 +1,213 @@
+"""
+Procesa consultas JSONL (una por línea) y escribe resultados JSONL.
+
+Cada consulta es un objeto JSON. Campos:
+  - "op":        "scale" (por defecto), "modes", "role", "chords", "interchange", "containing", "exact",
+                 "progression", "nearest" (escalas más parecidas), "path" (camino de modulación)
+                 o "stats" (métricas de holygrail.instrumentation; "format": "prometheus" para texto)
+  - "root", "mode", "variation":  para "scale", "modes", "role" y "chords" (acordes diatónicos)
+  - "note":      nota cuyo rol (Permitido/Evitado) se consulta con "role"
+  - "notes":     lista de notas para "containing" y "exact"
+  - "chords", "key": cifrados (texto) y tonalidad opcional para "progression";
+                 con "errors": "keep" un cifrado desconocido responde {"symbol", "error"}
+                 en su posición en lugar de anular toda la progresión
+  - "key", "chord", "home_mode": para "interchange" (modos paralelos que contienen el acorde)
+  - "spelling":  estrategia de enarmonización para "scale" ("key_signature" o "greedy")
+  - "register", "octaves": para "scale" y "modes", responde con alturas MIDI ("midi");
+                 "root" también puede ser directamente un número MIDI
+  - "k", "metric", "modes": para "nearest" ("metric": "voice_leading", "hamming" o "common_tones")
+  - "from", "to", "max_step", "metric", "modes": para "path"; "from" y "to" son [raíz, modo, variación?]
+  - "locale":    idioma de intervalos y roles: "es" (por defecto), "en" o "symbolic"
+  - "id":        opcional, se copia tal cual en la respuesta
+Una línea con una lista JSON de consultas es un lote: se responde con una
+línea que contiene la lista de respuestas, en el mismo orden.
+
+Uso:
+  python HolyGrailStream.py consultas.jsonl -o resultados.jsonl
+  cat consultas.jsonl | python HolyGrailStream.py
+"""
+import argparse
+import json
+import sys
+from array import array
+
+from holygrail import (
+    DEFAULT_SPELLING,
+    analyze_progression,
+    borrowed_scales,
+    calculate_major_scale,
+    calculate_modes_for_degrees,
+    diatonic_chords,
+    find_exact_scales,
+    find_scales_containing,
+    modulation_path,
+    nearest_scales,
+    pitch_class,
+)
+from holygrail import instrumentation
+from holygrail.names import DEFAULT_LOCALE, role_name
+from holygrail.mode_registry import mode_registry
+
+
+def note_role(root_note, note, mode, variation=None):
+    """
+    Rol de 'note' en la chord scale (root_note, mode, variation), o None si
+    la nota no pertenece a la escala.
+    """
+    root_index, note_index = pitch_class(root_note), pitch_class(note)
+    if root_index is None:
+        raise ValueError(f"Nota raíz inválida: {root_note}.")
+    if note_index is None:
+        raise ValueError(f"Nota inválida: {note}")
+    return mode_registry.role(mode, note_index - root_index, variation)
+
+
+def answer_query(query):
+    """
+    Resuelve una consulta ya decodificada y devuelve un dict serializable.
+    """
+    if not isinstance(query, dict):
+        raise ValueError("La consulta debe ser un objeto JSON")
+    op = query.get("op", "scale")
+    locale = query.get("locale")
+    if op == "scale":
+        result = calculate_major_scale(
+            query["root"], query.get("mode", "Ionian"),
+            variation=query.get("variation"), spelling=query.get("spelling", DEFAULT_SPELLING),
+            register=query.get("register"), octaves=query.get("octaves"),
+        )
+        if isinstance(result, array):
+            return {"midi": result.tolist()}
+        return result.to_dict(locale)
+    if op == "modes":
+        modes = calculate_modes_for_degrees(
+            query["root"], query.get("mode", "Ionian"),
+            register=query.get("register"), octaves=query.get("octaves"),
+        )
+        return {"modes": {
+            mode: {"midi": result.tolist()} if isinstance(result, array) else result.to_dict(locale)
+            for mode, result in modes.items()
+        }}
+    if op == "role":
+        role = note_role(query["root"], query["note"], query.get("mode", "Ionian"), query.get("variation"))
+        return {"note": query["note"], "role": role_name(role, locale or DEFAULT_LOCALE)}
+    if op == "chords":
+        return {"chords": [
+            {
+                "degree": c.degree, "numeral": c.numeral, "mode": c.mode, "symbol": c.symbol,
+                "triad": c.triad, "seventh": c.seventh,
+                "tensions": [
+                    {"name": t.name, "note": t.note, "role": role_name(t.role, locale or DEFAULT_LOCALE)}
+                    for t in c.tensions
+                ],
+            }
+            for c in diatonic_chords(query["root"], query.get("mode", "Ionian"))
+        ]}
+    if op == "interchange":
+        matches = borrowed_scales(query["key"], query["chord"], query.get("home_mode", "Ionian"))
+        return {"scales": [match._asdict() for match in matches]}
+    if op == "containing":
+        return {"scales": find_scales_containing(query["notes"])}
+    if op == "exact":
+        return {"scales": find_exact_scales(query["notes"])}
+    if op == "progression":
+        chords = analyze_progression(query["chords"], query.get("key"), query.get("spelling", DEFAULT_SPELLING),
+                                     query.get("errors", "raise"))
+        return {"chords": [
+            {"symbol": c.symbol, "error": c.error} if c.error is not None else
+            {"symbol": c.symbol, "root": c.root, "mode": c.mode, "variation": c.variation, **c.scale.to_dict(locale)}
+            for c in chords
+        ]}
+    if op == "nearest":
+        neighbors = nearest_scales(
+            query["root"], query.get("mode", "Ionian"), query.get("variation"),
+            k=query.get("k", 5), metric=query.get("metric", "voice_leading"), modes=query.get("modes"),
+        )
+        return {"scales": [neighbor._asdict() for neighbor in neighbors]}
+    if op == "path":
+        path = modulation_path(
+            tuple(query["from"]), tuple(query["to"]), query.get("max_step", 2),
+            query.get("metric", "voice_leading"), query.get("modes"),
+        )
+        return {"path": None if path is None else [scale._asdict() for scale in path]}
+    if op == "stats":
+        if query.get("format") == "prometheus":
+            return {"prometheus": instrumentation.to_prometheus()}
+        return instrumentation.snapshot()
+    raise ValueError(f"Operación inválida: {op}")
+
+
+def safe_answer(query):
+    """
+    answer_query sin excepciones: los errores se devuelven como {"error": ...}
+    y el "id" de la consulta, si lo hay, se copia en la respuesta.
+    """
+    try:
+        answer = answer_query(query)
+    except (ValueError, KeyError, TypeError) as exc:
+        answer = {"error": str(exc) if not isinstance(exc, KeyError) else f"Falta el campo: {exc.args[0]}"}
+    if isinstance(query, dict) and "id" in query:
+        answer = {"id": query["id"], **answer}
+    return answer
+
+
+def answer_line(line):
+    """
+    Respuesta JSON (sin salto de línea) a una línea de entrada: una consulta
+    o un lote (lista de consultas).
+    """
+    try:
+        payload = json.loads(line)
+    except ValueError as exc:
+        return json.dumps({"error": str(exc)}, ensure_ascii=False)
+    if isinstance(payload, list):
+        return json.dumps([safe_answer(query) for query in payload], ensure_ascii=False)
+    return json.dumps(safe_answer(payload), ensure_ascii=False)
+
+
+def stream_queries(lines):
+    """
+    Generador: por cada línea JSONL de entrada produce una línea JSONL de salida.
+    Las líneas vacías se ignoran; los errores se devuelven como {"error": ...}.
+    """
+    for line in lines:
+        if line.strip():
+            yield answer_line(line) + "\n"
+
+
+def write_stream(lines, output, chunk_size=1024):
+    """
+    Escribe las respuestas en bloques de 'chunk_size' líneas: memoria constante
+    y pocas llamadas de escritura.
+    """
+    chunk = []
+    for out_line in stream_queries(lines):
+        chunk.append(out_line)
+        if len(chunk) >= chunk_size:
+            output.writelines(chunk)
+            chunk.clear()
+    if chunk:
+        output.writelines(chunk)
+    output.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Consultas de escalas en formato JSONL.")
+    parser.add_argument("input", nargs="?", default="-", help="archivo JSONL de entrada ('-' = stdin)")
+    parser.add_argument("-o", "--output", default="-", help="archivo JSONL de salida ('-' = stdout)")
+    parser.add_argument("--chunk-size", type=int, default=1024, help="líneas por escritura")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", buffering=1 << 16)
+    try:
+        write_stream(source, target, args.chunk_size)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+
+if __name__ == "__main__":
+    main()
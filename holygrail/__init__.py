@@ -0,0 +1,144 @@
+"""
+HolyGrail: escalas, modos y chord scales.
+
+Hay dos estrategias de enarmonización intercambiables:
+  - "key_signature": según la armadura de la mayor relativa (holygrail.key_signature)
+  - "greedy":        primera enarmonía con letra no usada (holygrail.greedy)
+
+Importar el paquete no carga nada: los motores, el registro de modos y las
+tablas (catálogo, índice inverso, nombres) se cargan la primera vez que se usan.
+"""
+import importlib
+import sys
+
+DEFAULT_SPELLING = "key_signature"
+
+SPELLING_STRATEGIES = {
+    "key_signature": "holygrail.key_signature",
+    "greedy": "holygrail.greedy",
+}
+
+_SUBMODULES = {"binary_catalog", "detection", "greedy", "harmony", "instrumentation", "key_signature", "midi", "mode_registry", "names", "note_parser", "progression", "scale_cache", "scale_result", "similarity", "speller"}
+
+# Nombre público → submódulo que lo define (se importa al primer acceso)
+_LAZY_ATTRS = {
+    "BinaryCatalog": "binary_catalog",
+    "write_binary_catalog": "binary_catalog",
+    "KeyDetector": "detection",
+    "read_midi_notes": "detection",
+    "borrowed_scales": "harmony",
+    "diatonic_chord": "harmony",
+    "diatonic_chords": "harmony",
+    "ModeRegistry": "mode_registry",
+    "mode_registry": "mode_registry",
+    "interval_mask": "mode_registry",
+    "midi_pitches": "midi",
+    "midi_root": "midi",
+    "available_locales": "names",
+    "name_table": "names",
+    "ParsedNote": "note_parser",
+    "parse_note": "note_parser",
+    "pitch_class": "note_parser",
+    "analyze_progression": "progression",
+    "chord_scale": "progression",
+    "ScaleCache": "scale_cache",
+    "ScaleResult": "scale_result",
+    "interval_names": "scale_result",
+    "SimilarityMatrix": "similarity",
+    "modulation_path": "similarity",
+    "nearest_scales": "similarity",
+    "similarity_matrix": "similarity",
+    "build_scale_catalog": "key_signature",
+    "calculate_modes_for_degrees": "key_signature",
+    "calculate_root_scale": "key_signature",
+    "calculate_scales_batch": "key_signature",
+    "chromatic_scale": "key_signature",
+    "find_exact_scales": "key_signature",
+    "find_scales_containing": "key_signature",
+    "get_relative_major": "key_signature",
+    "iter_all_scales": "key_signature",
+    "major_key_signatures_en": "key_signature",
+    "mode_to_major_offset": "key_signature",
+}
+
+
+def get_engine(spelling=DEFAULT_SPELLING):
+    """
+    Devuelve el módulo del motor de la estrategia 'spelling'.
+    """
+    try:
+        module_name = SPELLING_STRATEGIES[spelling]
+    except KeyError:
+        raise ValueError(
+            f"Estrategia de enarmonización inválida: {spelling}. "
+            f"Disponibles: {', '.join(SPELLING_STRATEGIES)}"
+        ) from None
+    return importlib.import_module(module_name)
+
+
+def calculate_major_scale(root_note, mode="Ionian", chord_scale_type="standard", variation=None,
+                          spelling=DEFAULT_SPELLING, register=None, octaves=None):
+    """
+    calculate_major_scale del motor elegido con 'spelling'.
+    """
+    return get_engine(spelling).calculate_major_scale(root_note, mode, chord_scale_type, variation,
+                                                      register=register, octaves=octaves)
+
+
+def enable_cache(maxsize=1024):
+    """
+    Acota a 'maxsize' entradas (LRU) las cachés de todos los motores.
+    """
+    for spelling in SPELLING_STRATEGIES:
+        get_engine(spelling).enable_cache(maxsize)
+
+
+def disable_cache():
+    """
+    Catálogos sin límite y sin memoización auxiliar en todos los motores.
+    """
+    for spelling in SPELLING_STRATEGIES:
+        get_engine(spelling).disable_cache()
+
+
+def _loaded_engines():
+    # Solo los motores ya importados: un motor sin cargar no tiene nada en caché
+    for spelling, module_name in SPELLING_STRATEGIES.items():
+        module = sys.modules.get(module_name)
+        if module is not None:
+            yield spelling, module
+
+
+def invalidate_caches():
+    """
+    Vacía las cachés de todos los motores cargados.
+    """
+    for _, engine in _loaded_engines():
+        engine.invalidate_caches()
+
+
+def cache_stats():
+    """
+    Estadísticas de las cachés de los motores cargados; las del motor por
+    defecto sin prefijo y las de los demás como "<estrategia>.<caché>".
+    """
+    stats = {}
+    for spelling, engine in _loaded_engines():
+        prefix = "" if spelling == DEFAULT_SPELLING else f"{spelling}."
+        stats.update({prefix + name: value for name, value in engine.cache_stats().items()})
+    return stats
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES | set(_LAZY_ATTRS))
@@ -0,0 +1,225 @@
+"""
+Catálogo binario de escalas, pensado para abrirse con mmap y compartirse
+entre procesos: cada proceso lee las mismas páginas del archivo (solo
+lectura) y consulta los códigos a través de memoryview, sin copiarlos.
+
+Formato (little-endian, secciones alineadas a 8 bytes):
+  cabecera   HEADER (magic, versión, anchura, contadores y desplazamientos)
+  strings    tabla de cadenas UTF-8 separadas por NUL: raíces, modos,
+             variaciones ("" = sin variación), roles y estrategia de enarmonización
+  lengths    B × N   número de notas de cada escala
+  root_scale B × N   código de enarmonía de la "root scale" de la escala
+  relative   B × N   código de get_relative_major(raíz, modo) (PAD si el modo no
+                     es diatónico), el mismo en las variaciones de un modo
+  masks      H × N   máscara de 12 bits de las clases de altura (absolutas)
+  spellings  B × N×W códigos de enarmonía, rellenados con PAD hasta W
+  intervals  B × N×W intervalos en semitonos
+  roles      B × N×W códigos de rol (índices de la tabla de roles)
+con N = raíces × claves (modo, variación) y la escala (r, k) en la fila r × claves + k.
+"""
+import mmap
+import os
+import struct
+from collections import namedtuple
+
+from . import DEFAULT_SPELLING, get_engine
+from .key_signature import get_relative_major, mode_to_major_offset
+from .mode_registry import ROLE_NAMES, mode_registry, role_code
+from .note_parser import parse_note, pitch_class, spelling_code, spelling_from_code
+from .scale_result import ScaleResult
+
+MAGIC = b"HGCATLG\0"
+FORMAT_VERSION = 2
+WIDTH = 12  # notas máximas por escala
+PAD = 0xFF
+
+# magic, versión, anchura, raíces, claves, roles, tamaño de strings, 8 desplazamientos
+HEADER = struct.Struct("<8sHHIIII8I")
+SECTIONS = ("strings", "lengths", "root_scales", "relative_majors", "masks", "spellings", "intervals", "roles")
+
+# Vista sin copia de una escala del catálogo
+ScaleView = namedtuple("ScaleView", ["mask", "root_scale", "spellings", "intervals", "roles"])
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+def write_binary_catalog(path, spelling=DEFAULT_SPELLING):
+    """
+    Escribe el catálogo completo (cada enarmonía de 'chromatic_scale' × modo
+    × variación) en 'path'. El archivo se reemplaza de forma atómica, así que
+    un proceso que ya lo tenga mapeado sigue viendo la versión anterior.
+    """
+    engine = get_engine(spelling)
+    roots = [root_note for names in engine.chromatic_scale for root_note in names]
+    keys = [(compiled.mode, compiled.variation) for compiled in mode_registry]
+
+    lengths, root_scales, relative_majors, masks = bytearray(), bytearray(), bytearray(), []
+    spellings, intervals, roles = bytearray(), bytearray(), bytearray()
+    for root_note in roots:
+        root_index = pitch_class(root_note)
+        for mode, variation in keys:
+            result = engine.calculate_major_scale(root_note, mode, variation=variation)
+            pad = bytes([PAD]) * (WIDTH - len(result.interval_codes))
+            lengths.append(len(result.interval_codes))
+            root_scales.append(result.root_scale_code)
+            relative_majors.append(spelling_code(get_relative_major(root_note, mode))
+                                   if mode in mode_to_major_offset else PAD)
+            masks.append(sum(1 << (root_index + interval) % 12 for interval in result.interval_codes))
+            spellings += bytes(result.spelling_codes) + pad
+            intervals += bytes(result.interval_codes) + pad
+            roles += bytes(result.role_codes) + pad
+
+    strings = "\0".join(
+        roots + [mode for mode, _ in keys] + [variation or "" for _, variation in keys]
+        + list(ROLE_NAMES) + [spelling]
+    ).encode("utf-8")
+    sections = [strings, bytes(lengths), bytes(root_scales), bytes(relative_majors),
+                struct.pack(f"<{len(masks)}H", *masks),
+                bytes(spellings), bytes(intervals), bytes(roles)]
+
+    offsets, offset = [], _align(HEADER.size)
+    for data in sections:
+        offsets.append(offset)
+        offset = _align(offset + len(data))
+
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, WIDTH, len(roots), len(keys), len(ROLE_NAMES),
+                            len(strings), *offsets))
+        for data, start in zip(sections, offsets):
+            f.write(b"\0" * (start - f.tell()))
+            f.write(data)
+    os.replace(tmp_path, path)
+    return path
+
+
+class BinaryCatalog:
+    """
+    Catálogo binario mapeado en memoria (solo lectura).
+    get() y relative_major() devuelven lo mismo que calculate_major_scale (con
+    la enarmonización del archivo) y get_relative_major; view() da las
+    memoryview de los códigos sin copiarlos.
+    Los códigos de rol de view() son los del archivo (índices en 'role_names');
+    get() los traduce a los del proceso.
+
+    close() libera el archivo; si aún quedan vistas de view() en uso, el mapeo
+    sigue vivo hasta que se liberen y el catálogo queda cerrado igualmente.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+
+        magic, version, width, n_roots, n_keys, n_roles, strings_size, *offsets = HEADER.unpack_from(self._buffer)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"No es un catálogo binario de HolyGrail: {path}")
+        if version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Versión de catálogo no soportada: {version} (se esperaba {FORMAT_VERSION})")
+        self.width = width
+        offsets = dict(zip(SECTIONS, offsets))
+
+        strings = bytes(self._buffer[offsets["strings"]:offsets["strings"] + strings_size]).decode("utf-8").split("\0")
+        self.roots = strings[:n_roots]
+        modes = strings[n_roots:n_roots + n_keys]
+        variations = [name or None for name in strings[n_roots + n_keys:n_roots + 2 * n_keys]]
+        self.keys = list(zip(modes, variations))
+        self.role_names = tuple(strings[n_roots + 2 * n_keys:n_roots + 2 * n_keys + n_roles])
+        # Tabla (bytes.translate) código de rol del archivo → código del proceso; None si coinciden
+        role_map = bytes(role_code(name) for name in self.role_names)
+        self._role_table = None if role_map == bytes(range(n_roles)) else role_map.ljust(256, b"\0")
+        self.spelling = strings[-1]
+
+        self._root_index = {root_note: i for i, root_note in enumerate(self.roots)}
+        self._key_index = {key: i for i, key in enumerate(self.keys)}
+        self._modes = set(modes)
+
+        size = n_roots * n_keys
+        self.lengths = self._section(offsets, "lengths", size)
+        self.root_scales = self._section(offsets, "root_scales", size)
+        self.relative_majors = self._section(offsets, "relative_majors", size)
+        self.masks = self._section(offsets, "masks", 2 * size).cast("H")
+        self.spellings = self._section(offsets, "spellings", size * width)
+        self.intervals = self._section(offsets, "intervals", size * width)
+        self.roles = self._section(offsets, "roles", size * width)
+
+    def _section(self, offsets, name, size):
+        start = offsets[name]
+        return self._buffer[start:start + size]
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def index(self, root_note, mode, variation=None):
+        """
+        Fila de (root_note, mode, variation), con la misma normalización que
+        calculate_major_scale: raíz canónica y variaciones desconocidas → None.
+        """
+        root = self._root_index.get(root_note)
+        if root is None:
+            try:
+                root = self._root_index.get(parse_note(root_note).name)
+            except ValueError:
+                raise ValueError(f"Nota raíz inválida: {root_note}.") from None
+            if root is None:
+                raise ValueError(f"Raíz fuera del catálogo: {root_note}")
+        key = self._key_index.get((mode, variation))
+        if key is None:
+            if mode not in self._modes:
+                raise ValueError(f"Modo inválido: {mode}")
+            key = self._key_index[(mode, None)]
+        return root * len(self.keys) + key
+
+    def view(self, root_note, mode, variation=None):
+        """
+        ScaleView con memoryview (sin copia) de los códigos de la escala.
+        """
+        i = self.index(root_note, mode, variation)
+        start, n = i * self.width, self.lengths[i]
+        return ScaleView(
+            self.masks[i], self.root_scales[i], self.spellings[start:start + n],
+            self.intervals[start:start + n], self.roles[start:start + n],
+        )
+
+    def get(self, root_note, mode="Ionian", variation=None):
+        """
+        El mismo ScaleResult que calculate_major_scale(root_note, mode, variation=variation).
+        """
+        view = self.view(root_note, mode, variation)
+        roles = view.roles if self._role_table is None else bytes(view.roles).translate(self._role_table)
+        return ScaleResult.from_codes(view.spellings, view.intervals, roles, view.root_scale)
+
+    def relative_major(self, root_note, mode):
+        """
+        La misma tónica que get_relative_major(root_note, mode), también en los
+        catálogos con enarmonización "greedy"; ValueError si el modo no es diatónico.
+        """
+        code = self.relative_majors[self.index(root_note, mode)]
+        if code == PAD:
+            raise ValueError(f"Modo inválido: {mode}")
+        return spelling_from_code(code).name
+
+    def close(self):
+        for name in ("masks", "lengths", "root_scales", "relative_majors", "spellings", "intervals", "roles"):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        buffer, mapping = self.__dict__.pop("_buffer", None), self.__dict__.pop("_mmap", None)
+        if buffer is None:
+            return
+        try:
+            buffer.release()
+            mapping.close()
+        except BufferError:
+            # Quedan vistas de view() en uso: el mapeo se cierra cuando se liberen
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,207 @@
+"""
+Detección continua de tonalidad y modo sobre un flujo de notas.
+
+KeyDetector mantiene un histograma de clases de altura de las últimas
+'window' notas y la puntuación (sin normalizar) de cada candidato (raíz, modo).
+Al entrar o salir una nota solo se actualizan los candidatos que contienen su
+clase de altura o tienen esa raíz, así que cada paso cuesta lo mismo sea cual
+sea la ventana o la longitud del flujo; no se construye ninguna escala con
+calculate_major_scale.
+
+Puntuación de un candidato (0-1):
+  (notas de la ventana dentro de la escala + tonic_weight × apariciones de la raíz)
+  / (notas de la ventana × (1 + tonic_weight))
+El peso de la raíz desempata los modos que comparten notas (C Ionian / A Aeolian).
+"""
+import heapq
+import re
+from collections import deque, namedtuple
+
+from .key_signature import _index_root_name
+from .mode_registry import mode_registry
+from .note_parser import pitch_class
+
+Detection = namedtuple("Detection", ["root", "mode", "score"])
+
+DIATONIC_MODES = ("Ionian", "Dorian", "Phrygian", "Lydian", "Mixolydian", "Aeolian", "Locrian")
+DEFAULT_WINDOW = 32
+DEFAULT_TONIC_WEIGHT = 0.5
+
+# Nombre de nota con octava opcional: "Bb", "c#4", "F##-1"
+_NOTE_TOKEN = re.compile(r"^(.*?)(-?\d+)?$")
+
+
+class KeyDetector:
+    def __init__(self, window=DEFAULT_WINDOW, modes=DIATONIC_MODES, tonic_weight=DEFAULT_TONIC_WEIGHT):
+        if window < 1:
+            raise ValueError(f"Ventana inválida: {window}")
+        self.window = window
+        self.tonic_weight = tonic_weight
+
+        # Candidatos y, por clase de altura, (candidato, incremento) que le afectan:
+        # +1 si la escala la contiene y +tonic_weight si además es su raíz
+        self.candidates = []
+        updates = [{} for _ in range(12)]
+        for mode in modes:
+            intervals = mode_registry.get(mode).intervals
+            for root_index in range(12):
+                index = len(self.candidates)
+                for interval in intervals:
+                    updates[(root_index + interval) % 12][index] = 1
+                updates[root_index][index] = updates[root_index].get(index, 0) + tonic_weight
+                self.candidates.append((root_index, _index_root_name(root_index), mode))
+        self._updates = tuple(tuple(update.items()) for update in updates)
+        self.reset()
+
+    def reset(self):
+        self._notes = deque()
+        self.histogram = [0] * 12
+        self._raw = [0] * len(self.candidates)
+
+    def __len__(self):
+        return len(self._notes)
+
+    def _add(self, pc, step):
+        self.histogram[pc] += step
+        raw = self._raw
+        for index, increment in self._updates[pc]:
+            raw[index] += step * increment
+
+    def push(self, note):
+        """
+        Añade una nota (nombre, nombre con octava o número MIDI) y quita la
+        más antigua si la ventana está llena. Devuelve la clase de altura.
+        """
+        pc = note_pitch_class(note)
+        self._notes.append(pc)
+        self._add(pc, 1)
+        if len(self._notes) > self.window:
+            self._add(self._notes.popleft(), -1)
+        return pc
+
+    def scores(self):
+        """
+        Lista de Detection de todos los candidatos, de mayor a menor puntuación.
+        """
+        return self.best(len(self.candidates))
+
+    def best(self, top=1):
+        """
+        Los 'top' candidatos con mayor puntuación (en orden de candidatos si empatan).
+        """
+        total = len(self._notes)
+        if not total:
+            return []
+        raw = self._raw
+        if top == 1:
+            indices = [max(range(len(raw)), key=raw.__getitem__)]
+        else:
+            indices = heapq.nlargest(top, range(len(raw)), key=raw.__getitem__)
+        scale = total * (1 + self.tonic_weight)
+        return [Detection(*self.candidates[i][1:], raw[i] / scale) for i in indices]
+
+    def feed(self, notes, top=1):
+        """
+        Generador: por cada nota de 'notes' produce (clase de altura, mejores 'top').
+        """
+        for note in notes:
+            pc = self.push(note)
+            yield pc, self.best(top)
+
+
+def note_pitch_class(note):
+    """
+    Clase de altura de un número MIDI o de un nombre de nota con octava opcional.
+    """
+    if isinstance(note, int):
+        return note % 12
+    pc = pitch_class(note)
+    if pc is None:
+        pc = pitch_class(_NOTE_TOKEN.match(note.strip()).group(1))
+        if pc is None:
+            raise ValueError(f"Nota inválida: {note}")
+    return pc
+
+
+def parse_note_tokens(text):
+    """
+    Notas de un texto separadas por espacios, comas o barras ('|'). Los
+    números se leen como notas MIDI.
+    """
+    for token in re.split(r"[\s,|]+", text):
+        if token:
+            yield int(token) if token.isdigit() else token
+
+
+# ---------------------------------------------
+# LECTURA DE ARCHIVOS MIDI (STANDARD MIDI FILE)
+# ---------------------------------------------
+PERCUSSION_CHANNEL = 9  # canal 10: sin altura definida
+
+
+def _read_varlen(data, pos):
+    value = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value = (value << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            return value, pos
+
+
+def _track_note_ons(data, skip_percussion):
+    # (tick absoluto, nota) de cada note-on con velocidad > 0
+    events = []
+    pos, tick, status = 0, 0, None
+    while pos < len(data):
+        delta, pos = _read_varlen(data, pos)
+        tick += delta
+        byte = data[pos]
+        if byte & 0x80:
+            status = byte
+            pos += 1
+        elif status is None:
+            raise ValueError("Archivo MIDI inválido: dato sin estado")
+
+        if status == 0xFF:  # meta evento
+            pos += 1
+            length, pos = _read_varlen(data, pos)
+            pos += length
+            status = None
+        elif status in (0xF0, 0xF7):  # sysex
+            length, pos = _read_varlen(data, pos)
+            pos += length
+            status = None
+        else:
+            kind, channel = status & 0xF0, status & 0x0F
+            size = 1 if kind in (0xC0, 0xD0) else 2
+            if kind == 0x90 and data[pos + 1] > 0 and not (skip_percussion and channel == PERCUSSION_CHANNEL):
+                events.append((tick, data[pos]))
+            pos += size
+    return events
+
+
+def read_midi_notes(path, skip_percussion=True):
+    """
+    Números MIDI de los note-on de un archivo .mid, en orden temporal
+    (todas las pistas mezcladas). Se ignora el canal de percusión.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:4] != b"MThd":
+        raise ValueError(f"No es un archivo MIDI: {path}")
+    header_length = int.from_bytes(data[4:8], "big")
+    pos = 8 + header_length
+
+    events = []
+    while pos + 8 <= len(data):
+        chunk, length = data[pos:pos + 4], int.from_bytes(data[pos + 4:pos + 8], "big")
+        pos += 8
+        if chunk == b"MTrk":
+            try:
+                events.extend(_track_note_ons(data[pos:pos + length], skip_percussion))
+            except IndexError:
+                raise ValueError(f"Archivo MIDI truncado: {path}") from None
+        pos += length
+    events.sort(key=lambda event: event[0])
+    return [note for _, note in events]
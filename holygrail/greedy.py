@@ -0,0 +1,196 @@
+"""
+Motor de escalas con enarmonización voraz (antes HolyGrail4.5.py):
+cada nota toma la primera enarmonía cuya letra no se haya usado.
+"""
+from .midi import check_octaves, midi_pitches, midi_root
+from .mode_registry import mode_registry
+from .note_parser import parse_note, pitch_class
+from .scale_cache import ScaleCache
+from .scale_result import ScaleResult, interval_names
+
+# Estrategia de enarmonización de este motor
+SPELLING_STRATEGY = "greedy"
+
+chromatic_scale = [
+    ["C", "B#", "Dbb"],  # 0
+    ["C#", "Db", "B##"],  # 1
+    ["D", "C##", "Ebb"],  # 2
+    ["D#", "Eb", "Fbb"],  # 3
+    ["E", "Fb", "D##"],  # 4
+    ["F", "E#", "Gbb"],  # 5
+    ["F#", "Gb", "E##"],  # 6
+    ["G", "F##", "Abb"],  # 7
+    ["G#", "Ab", "F###"],  # 8
+    ["A", "G##", "Bbb"],  # 9
+    ["A#", "Bb", "Cbb"],  # 10
+    ["B", "Cb", "A##"]   # 11
+]
+
+mode_shifts = {
+    "Ionian": 0, "Dorian": -2, "Phrygian": -4, "Lydian": 5,
+    "Mixolydian": -7, "Aeolian": -9, "Locrian": -11
+}
+
+mode_definitions = mode_registry.definitions  # cargado de mode_definitions.json
+
+def calculate_root_scale(root_note, mode, scale_notes=None):
+    """
+    Calcula la nota raíz ajustada al modo especificado y asegura consistencia en la selección de enarmonías.
+    """
+    if mode not in mode_shifts:
+        raise ValueError(f"Modo inválido para calcular escala raíz: {mode}.")
+
+    root_index = find_root_index(chromatic_scale, root_note)
+    if root_index is None:
+        raise ValueError(f"Nota raíz inválida: {root_note}.")
+
+    shift = mode_shifts[mode] % 12
+    root_scale_index = (root_index + shift) % 12
+    enharmonics = chromatic_scale[root_scale_index]
+
+    # Verificar si scale_notes está definido
+    if scale_notes:
+        # Comparar las enarmonías con las notas de la escala ya calculadas
+        for enharmonic in enharmonics:
+            if enharmonic in scale_notes:
+                return enharmonic
+
+    # Si no hay concordancia, usar la lógica habitual (criterio de letras)
+    used_letters = {note[0] for note in scale_notes} if scale_notes else set()
+    for enharmonic in enharmonics:
+        if enharmonic[0] not in used_letters:
+            return enharmonic
+
+    # Si no se puede evitar la repetición, usar la primera opción
+    return enharmonics[0]
+
+def find_root_index(chromatic_scale, root_note):
+    # Búsqueda O(1) en el índice de note_parser (cualquier alteración, minúsculas, ♯/♭)
+    return pitch_class(root_note)
+
+# Nueva función auxiliar para seleccionar la mejor enarmonía
+def select_enharmonic(options, used_notes):
+    """
+    Selecciona la enarmonía más adecuada basándose en las letras ya usadas.
+    Si ninguna opción evita conflictos, devuelve la primera.
+    """
+    for option in options:
+        if option[0] not in used_notes:
+            return option
+    return options[0]  # Si no hay opciones sin conflictos, usar la primera
+
+def calculate_modes_for_degree(root_scale):
+    """
+    Calcula los modos correctamente desde la escala raíz seleccionada.
+    Aplica los desplazamientos modales adecuados y conserva el formato esperado.
+    No imprime nada: devuelve {modo: ScaleResult} con las entradas compartidas del catálogo.
+    """
+    mode_names = ["Ionian", "Dorian", "Phrygian", "Lydian", "Mixolydian", "Aeolian", "Locrian"]
+    return {mode_name: calculate_major_scale(root_scale, mode=mode_name) for mode_name in mode_names}
+
+def normalize_scale_key(root_note, mode, variation=None):
+    """
+    Devuelve la clave canónica (root_note, mode, variation) de una consulta.
+    La raíz se normaliza a su nombre canónico ("f♯" → "F#") y las
+    variaciones que el modo no define se descartan (variation=None).
+    """
+    if mode not in mode_registry:
+        raise ValueError(f"Modo inválido: {mode}. Modos disponibles: {', '.join(mode_registry.modes())}")
+
+    try:
+        root_note = parse_note(root_note).name
+    except ValueError:
+        raise ValueError(f"Nota raíz inválida: {root_note}.") from None
+
+    if not mode_registry.has_variation(mode, variation):
+        variation = None
+    return (root_note, mode, variation)
+
+def _build_major_scale(root_note, mode, variation):
+    compiled = mode_registry.get(mode, variation)
+
+    root_index = find_root_index(chromatic_scale, root_note)
+    if root_index is None:
+        raise ValueError(f"Nota raíz inválida: {root_note}.")
+
+    used_letters = set()  # Inicializa el conjunto para evitar repetición de letras
+    scale_notes = []  # Asegura que siempre existe este conjunto
+
+    for interval in compiled.intervals:
+        current_index = (root_index + interval) % 12
+        note_options = chromatic_scale[current_index]
+
+        # Selección con criterio de no repetición
+        note = select_enharmonic(note_options, used_letters)
+
+        used_letters.add(note[0])
+        scale_notes.append(note)
+
+    if compiled.family is not None:
+        # Modo generado por una familia: la raíz de la escala padre, con la enarmonía usada en la escala
+        options = chromatic_scale[(root_index + compiled.family.parent_interval) % 12]
+        root_scale = next((option for option in options if option in scale_notes), options[0])
+    elif mode in mode_shifts:
+        # Pasa scale_notes a calculate_root_scale
+        root_scale = calculate_root_scale(root_note, mode, scale_notes)
+    else:
+        # Modo añadido desde un archivo de definiciones: sin mayor relativa, la propia raíz
+        root_scale = root_note
+
+    return ScaleResult.pack(scale_notes, compiled.intervals, compiled.role_codes, root_scale)
+
+# Catálogo (root_note, mode, variation) → resultado compartido, llenado bajo demanda.
+# Sin límite por defecto; enable_cache(maxsize) lo convierte en una LRU acotada.
+_scale_catalog = ScaleCache()
+
+def calculate_major_scale(root_note, mode="Ionian", chord_scale_type="standard", variation=None,
+                          register=None, octaves=None):
+    """
+    Consulta el catálogo de escalas; solo construye la escala la primera vez que se pide.
+    El resultado es un ScaleResult inmutable y se comparte entre llamadas.
+    Con un número MIDI, 'register' u 'octaves' devuelve un array('B') de alturas MIDI.
+    """
+    if register is not None or octaves is not None or isinstance(root_note, int):
+        compiled = mode_registry.get(mode, variation)
+        return midi_pitches(midi_root(root_note, register), compiled.mask, check_octaves(octaves))
+    result = _scale_catalog.get((root_note, mode, variation))
+    if result is None:
+        key = normalize_scale_key(root_note, mode, variation)
+        result = _scale_catalog.get(key)
+        if result is None:
+            result = _build_major_scale(*key)
+            _scale_catalog.put(key, result)
+    return result
+
+def build_scale_catalog():
+    """
+    Precalcula todas las combinaciones enarmonía × modo × variación.
+    """
+    for names in chromatic_scale:
+        for root_note in names:
+            for compiled in mode_registry:
+                calculate_major_scale(root_note, compiled.mode, variation=compiled.variation)
+    return _scale_catalog
+
+def enable_cache(maxsize=1024):
+    """
+    Limita el catálogo a una LRU de 'maxsize' entradas.
+    """
+    _scale_catalog.resize(maxsize)
+
+def disable_cache():
+    """
+    Vuelve al catálogo sin límite.
+    """
+    _scale_catalog.resize(None)
+
+def invalidate_caches():
+    """
+    Vacía el catálogo. Se llama sola cuando cambia mode_registry.
+    """
+    _scale_catalog.clear()
+
+def cache_stats():
+    return {"calculate_major_scale": _scale_catalog.stats()}
+
+mode_registry.add_listener(invalidate_caches)
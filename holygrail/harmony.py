@@ -0,0 +1,202 @@
+"""
+Armonía diatónica: tríadas, cuatríadas y tensiones de cada grado de una tonalidad.
+
+Para una tonalidad (raíz, modo) el grado d toma como chord scale el modo
+diatónico de ese grado (la rotación de la mayor relativa) construido sobre la
+d-ésima nota de calculate_major_scale(raíz, modo); así el grado 1 conserva la
+enarmonía pedida (G# Ionian empieza en G#maj7, no en Abmaj7). Sobre ella se
+apilan terceras:
+  - tríada:     1, 3, 5 de la chord scale
+  - cuatríada:  1, 3, 5, 7
+  - tensiones:  9, 11, 13, con su rol (Permitido/Evitado) en la chord scale
+Las tablas de cada tonalidad se calculan una vez y se guardan en caché por
+(raíz, modo); cambiar mode_registry las invalida.
+
+Intercambio modal (borrowed_scales): qué modos o variaciones paralelos (misma
+raíz que la tonalidad) contienen las notas de un acorde, ordenados por notas
+en común con la tonalidad de partida.
+"""
+from collections import namedtuple
+
+from .key_signature import (
+    calculate_major_scale,
+    chromatic_scale,
+    get_relative_major,
+    mode_to_major_offset,
+    notes_to_mask,
+)
+from .mode_registry import ROLE_NAMES, interval_mask, mode_registry
+from .note_parser import pitch_class, spelling_from_code
+from .progression import CHORD_QUALITIES, parse_chord_symbol
+from .scale_cache import ScaleCache
+
+DiatonicChord = namedtuple("DiatonicChord", [
+    "degree", "numeral", "mode", "root",
+    "triad", "triad_quality", "seventh", "seventh_quality", "symbol",
+    "tensions", "chord_scale",
+])
+Tension = namedtuple("Tension", ["name", "note", "role"])
+BorrowedScale = namedtuple("BorrowedScale", ["mode", "variation", "common_tones", "parent", "borrowed"])
+
+DEGREE_MODES = ("Ionian", "Dorian", "Phrygian", "Lydian", "Mixolydian", "Aeolian", "Locrian")
+ROMAN_NUMERALS = ("I", "II", "III", "IV", "V", "VI", "VII")
+
+# Intervalos (3ª, 5ª) → calidad de la tríada
+TRIAD_QUALITIES = {(4, 7): "maj", (3, 7): "m", (3, 6): "dim", (4, 8): "aug"}
+
+# Intervalos (3ª, 5ª, 7ª) → sufijo del cifrado de la cuatríada
+SEVENTH_QUALITIES = {
+    (4, 7, 11): "maj7", (4, 7, 10): "7", (3, 7, 10): "m7", (3, 6, 10): "m7b5",
+    (3, 6, 9): "dim7", (3, 7, 11): "m(maj7)", (4, 8, 11): "maj7#5", (4, 8, 10): "7#5",
+}
+
+# Posición en la chord scale y nombre de cada tensión según su intervalo
+TENSIONS = (
+    (1, {1: "b9", 2: "9", 3: "#9"}),
+    (3, {4: "b11", 5: "11", 6: "#11"}),
+    (5, {8: "b13", 9: "13", 10: "#13"}),
+)
+
+# Caché por (raíz, modo): tupla de 7 DiatonicChord
+_chord_tables = ScaleCache()
+mode_registry.add_listener(_chord_tables.clear)
+
+
+def _numeral(degree, triad_quality):
+    numeral = ROMAN_NUMERALS[degree - 1]
+    if triad_quality in ("m", "dim"):
+        numeral = numeral.lower()
+    if triad_quality == "dim":
+        numeral += "°"
+    elif triad_quality == "aug":
+        numeral += "+"
+    return numeral
+
+
+def _degree_chord(degree, mode, chord_scale):
+    spellings = chord_scale.spelling_codes
+    intervals = chord_scale.interval_codes
+    roles = chord_scale.role_codes
+    if len(intervals) != 7:
+        raise ValueError(f"La chord scale de {mode} no es heptatónica")
+
+    names = tuple(spelling_from_code(code).name for code in spellings)
+    triad_quality = TRIAD_QUALITIES.get((intervals[2], intervals[4]), "?")
+    seventh_quality = SEVENTH_QUALITIES.get((intervals[2], intervals[4], intervals[6]), "?")
+    tensions = tuple(
+        Tension(labels.get(intervals[position], str(intervals[position])), names[position],
+                ROLE_NAMES[roles[position]])
+        for position, labels in TENSIONS
+    )
+    return DiatonicChord(
+        degree, _numeral(degree, triad_quality), mode, names[0],
+        (names[0], names[2], names[4]), triad_quality,
+        (names[0], names[2], names[4], names[6]), seventh_quality, names[0] + seventh_quality,
+        tensions, chord_scale,
+    )
+
+
+def _build_table(root_note, mode):
+    if mode not in mode_to_major_offset:
+        raise ValueError(f"Modo inválido: {mode}. Modos diatónicos: {', '.join(DEGREE_MODES)}")
+    # Raíz de cada grado tal como la escribe la escala pedida (el grado 1 es 'root_note')
+    degree_roots = calculate_major_scale(root_note, mode)["notes"]
+    start = DEGREE_MODES.index(mode)
+    chords = []
+    for degree, degree_root in enumerate(degree_roots, start=1):
+        degree_mode = DEGREE_MODES[(start + degree - 1) % 7]
+        chords.append(_degree_chord(degree, degree_mode, calculate_major_scale(degree_root, degree_mode)))
+    return tuple(chords)
+
+
+def diatonic_chords(root_note, mode="Ionian"):
+    """
+    Tupla de 7 DiatonicChord (grados 1-7) de la tonalidad (root_note, mode).
+    """
+    key = (root_note, mode)
+    table = _chord_tables.get(key)
+    if table is None:
+        table = _build_table(root_note, mode)
+        _chord_tables.put(key, table)
+    return table
+
+
+def diatonic_chord(root_note, mode, degree):
+    """
+    DiatonicChord del grado 'degree' (1-7) de la tonalidad (root_note, mode).
+    """
+    if not 1 <= degree <= 7:
+        raise ValueError(f"Grado inválido: {degree}")
+    return diatonic_chords(root_note, mode)[degree - 1]
+
+
+def build_chord_tables():
+    """
+    Precalcula las tablas de todas las enarmonías de 'chromatic_scale' en los 7 modos.
+    """
+    for names in chromatic_scale:
+        for root_note in names:
+            for mode in DEGREE_MODES:
+                diatonic_chords(root_note, mode)
+    return _chord_tables
+
+
+def chord_table_stats():
+    return _chord_tables.stats()
+
+
+# ---------------------------------------------
+# INTERCAMBIO MODAL
+# ---------------------------------------------
+# Para cada clase de altura de la raíz, (modo, variación, máscara absoluta) de
+# cada entrada del registro. Se construye la primera vez que se consulta (y de
+# nuevo si cambia mode_registry).
+_parallel_index = {"version": None, "masks": ()}
+
+
+def _parallel_masks(key_index):
+    if _parallel_index["version"] != mode_registry.version:
+        _parallel_index["masks"] = tuple(
+            tuple(
+                (compiled.mode, compiled.variation, interval_mask(key + interval for interval in compiled.intervals))
+                for compiled in mode_registry
+            )
+            for key in range(12)
+        )
+        _parallel_index["version"] = mode_registry.version
+    return _parallel_index["masks"][key_index]
+
+
+def chord_mask(chord):
+    """
+    Máscara de clases de altura de un cifrado ("Fm7") o de una lista de notas.
+    """
+    if isinstance(chord, str):
+        root, suffix = parse_chord_symbol(chord)
+        return interval_mask(root.pitch_class + interval for interval in CHORD_QUALITIES[suffix][0])
+    return notes_to_mask(chord)
+
+
+def borrowed_scales(key, chord, home_mode="Ionian"):
+    """
+    Modos y variaciones paralelos a 'key' cuyas notas contienen las de 'chord',
+    ordenados por notas en común con (key, home_mode), de más a menos.
+    Devuelve una lista de BorrowedScale: 'parent' es la mayor relativa del modo
+    (None en las variaciones) y 'borrowed' indica si el acorde no pertenece a
+    la tonalidad de partida.
+    """
+    key_index = pitch_class(key)
+    if key_index is None:
+        raise ValueError(f"Nota raíz inválida: {key}.")
+    home_mask = interval_mask(key_index + interval for interval in mode_registry.get(home_mode).intervals)
+    target = chord_mask(chord)
+    borrowed = target & ~home_mask != 0
+
+    matches = []
+    for mode, variation, mask in _parallel_masks(key_index):
+        if target & ~mask == 0:
+            common = (mask & home_mask).bit_count()
+            parent = get_relative_major(key, mode) if variation is None and mode in mode_to_major_offset else None
+            matches.append(BorrowedScale(mode, variation, common, parent, borrowed))
+    matches.sort(key=lambda match: match.common_tones, reverse=True)
+    return matches
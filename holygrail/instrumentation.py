@@ -0,0 +1,190 @@
+"""
+Instrumentación opcional de las etapas de cálculo de escalas.
+
+enable() reemplaza en los módulos de los motores las funciones de INSTRUMENTED
+por versiones que cuentan llamadas y miden su duración; disable() restaura
+las originales. Mientras está desactivada no hay ningún envoltorio, así que
+el coste es nulo. Los tiempos son inclusivos (calculate_major_scale incluye
+lo que tarden las funciones a las que llama).
+
+Exportación: snapshot() (dict) y to_prometheus() (formato de texto de Prometheus).
+"""
+import importlib
+import sys
+import time
+from collections import deque
+from functools import wraps
+
+# Módulo del motor → funciones medidas
+INSTRUMENTED = {
+    "key_signature": (
+        "find_root_index", "get_relative_major", "pick_note_for_key_signature", "calculate_root_scale",
+        "spell_scale_codes", "_build_major_scale", "calculate_major_scale",
+    ),
+    "greedy": (
+        "find_root_index", "select_enharmonic", "calculate_root_scale",
+        "_build_major_scale", "calculate_major_scale",
+    ),
+}
+
+DEFAULT_SAMPLE_SIZE = 4096  # últimas duraciones guardadas por función (para percentiles)
+QUANTILES = (0.5, 0.9, 0.99)
+
+_originals = {}  # (módulo, nombre) → función original
+_stats = {}      # "módulo.nombre" → CallStats
+
+
+class CallStats:
+    __slots__ = ("count", "total_ns", "samples")
+
+    def __init__(self, sample_size=DEFAULT_SAMPLE_SIZE):
+        self.count = 0
+        self.total_ns = 0
+        self.samples = deque(maxlen=sample_size)
+
+    def quantiles(self, fractions=QUANTILES):
+        """
+        Duraciones (ns) en los percentiles 'fractions' de las últimas muestras.
+        """
+        ordered = sorted(self.samples)
+        if not ordered:
+            return [0 for _ in fractions]
+        return [ordered[min(len(ordered) - 1, int(round(f * (len(ordered) - 1))))] for f in fractions]
+
+    def to_dict(self):
+        p50, p90, p99 = self.quantiles((0.50, 0.90, 0.99))
+        return {
+            "count": self.count,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": self.total_ns / self.count / 1000 if self.count else 0.0,
+            "p50_us": p50 / 1000,
+            "p90_us": p90 / 1000,
+            "p99_us": p99 / 1000,
+        }
+
+
+def _probe(func, stats):
+    clock = time.perf_counter_ns
+    samples = stats.samples
+
+    @wraps(func, updated=())
+    def probe(*args, **kwargs):
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = clock() - start
+            stats.count += 1
+            stats.total_ns += elapsed
+            samples.append(elapsed)
+
+    return probe
+
+
+def is_enabled():
+    return bool(_originals)
+
+
+def enable(sample_size=DEFAULT_SAMPLE_SIZE):
+    """
+    Activa la medición de todas las funciones de INSTRUMENTED. Los contadores
+    acumulados se conservan si ya existían.
+    """
+    if _originals:
+        return
+    for module_name, names in INSTRUMENTED.items():
+        module = importlib.import_module(f"holygrail.{module_name}")
+        for name in names:
+            stats = _stats.get(f"{module_name}.{name}")
+            if stats is None:
+                stats = _stats[f"{module_name}.{name}"] = CallStats(sample_size)
+            original = getattr(module, name)
+            _originals[(module, name)] = original
+            setattr(module, name, _probe(original, stats))
+
+
+def disable():
+    """
+    Restaura las funciones originales. Los contadores se conservan hasta reset().
+    """
+    for (module, name), original in _originals.items():
+        setattr(module, name, original)
+    _originals.clear()
+
+
+def reset():
+    """
+    Pone a cero contadores, duraciones y estadísticas de las cachés.
+    """
+    for stats in _stats.values():
+        stats.count = stats.total_ns = 0
+        stats.samples.clear()
+    for cache in _caches().values():
+        cache.reset_stats()
+
+
+def _caches():
+    # Solo las cachés de los módulos ya cargados: exportar no debe cargar motores
+    caches = {}
+    key_signature = sys.modules.get("holygrail.key_signature")
+    if key_signature is not None:
+        caches["calculate_major_scale"] = key_signature._scale_catalog
+        caches["calculate_modes_for_degrees"] = key_signature._degree_tables
+        for func in key_signature._memoized:
+            if func.cache is not None:
+                caches[func.__name__] = func.cache
+    greedy = sys.modules.get("holygrail.greedy")
+    if greedy is not None:
+        caches["greedy.calculate_major_scale"] = greedy._scale_catalog
+    progression = sys.modules.get("holygrail.progression")
+    if progression is not None:
+        caches["chord_scale"] = progression._chord_cache
+    return caches
+
+
+def snapshot():
+    """
+    {"enabled": bool, "functions": {nombre: {...}}, "caches": {nombre: {...}}}
+    con los tiempos en milisegundos (total) y microsegundos (media y percentiles).
+    """
+    return {
+        "enabled": is_enabled(),
+        "functions": {name: stats.to_dict() for name, stats in _stats.items() if stats.count},
+        "caches": {name: cache.stats() for name, cache in _caches().items()},
+    }
+
+
+def to_prometheus(prefix="holygrail"):
+    """
+    Las mismas métricas que snapshot() en el formato de texto de Prometheus.
+    """
+    lines = [
+        f"# HELP {prefix}_calls_total Llamadas por función.",
+        f"# TYPE {prefix}_calls_total counter",
+    ]
+    measured = [(name, stats) for name, stats in _stats.items() if stats.count]
+    for name, stats in measured:
+        lines.append(f'{prefix}_calls_total{{function="{name}"}} {stats.count}')
+
+    lines += [
+        f"# HELP {prefix}_call_seconds Duración de las llamadas (inclusiva).",
+        f"# TYPE {prefix}_call_seconds summary",
+    ]
+    for name, stats in measured:
+        for fraction, value in zip(QUANTILES, stats.quantiles()):
+            lines.append(f'{prefix}_call_seconds{{function="{name}",quantile="{fraction}"}} {value / 1e9:.9f}')
+        lines.append(f'{prefix}_call_seconds_sum{{function="{name}"}} {stats.total_ns / 1e9:.9f}')
+        lines.append(f'{prefix}_call_seconds_count{{function="{name}"}} {stats.count}')
+
+    caches = _caches()
+    for metric, kind, help_text, field in (
+        ("cache_hits_total", "counter", "Aciertos de caché.", "hits"),
+        ("cache_misses_total", "counter", "Fallos de caché.", "misses"),
+        ("cache_evictions_total", "counter", "Entradas desalojadas.", "evictions"),
+        ("cache_size", "gauge", "Entradas en caché.", "size"),
+        ("cache_hit_ratio", "gauge", "Proporción de aciertos.", "hit_rate"),
+    ):
+        lines += [f"# HELP {prefix}_{metric} {help_text}", f"# TYPE {prefix}_{metric} {kind}"]
+        for name, cache in caches.items():
+            lines.append(f'{prefix}_{metric}{{cache="{name}"}} {cache.stats()[field]}')
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,621 @@
+"""
+Motor de escalas con enarmonización por armadura (antes HolyHarmonyGrail1.py):
+cada nota se escribe según la armadura de la mayor relativa.
+"""
+from array import array
+from itertools import repeat
+from operator import itemgetter
+
+from .midi import MIDI_MIN, check_octaves, midi_pitches, midi_root
+from .mode_registry import interval_mask, mode_registry
+from .note_parser import parse_note, pitch_class, spelling_code, spelling_from_code
+from .scale_cache import ScaleCache, memoize
+from .scale_result import ScaleResult, interval_names
+from .speller import spell_interval, spell_scale_codes
+
+# ---------------------------------------------
+# 1) ESCALA CROMÁTICA Y ESTRUCTURAS GLOBALES
+# ---------------------------------------------
+chromatic_scale = [
+    ["C", "B#", "Dbb"],   # 0
+    ["C#", "Db", "B##"],  # 1
+    ["D", "C##", "Ebb"],  # 2
+    ["D#", "Eb", "Fbb"],  # 3
+    ["E", "Fb", "D##"],   # 4
+    ["F", "E#", "Gbb"],   # 5
+    ["F#", "Gb", "E##"],  # 6
+    ["G", "F##", "Abb"],  # 7
+    ["G#", "Ab", "F###"], # 8
+    ["A", "G##", "Bbb"],  # 9
+    ["A#", "Bb", "Cbb"],  # 10
+    ["B", "Cb", "A##"]    # 11
+]
+
+# Armaduras de las tonalidades mayores (en inglés)
+major_key_signatures_en = {
+    # 0 accidentals
+    "C":  0,
+    # + sharps (1 a 7)
+    "G":  1,  
+    "D":  2,
+    "A":  3,
+    "E":  4,
+    "B":  5,
+    "F#": 6,
+    "C#": 7,
+    # - flats (1 a 7)
+    "F":  -1, 
+    "Bb": -2,
+    "Eb": -3,
+    "Ab": -4,
+    "Db": -5,
+    "Gb": -6,
+    "Cb": -7
+}
+
+# Mapeo: modo → offset (en semitonos) para llegar a su relativo mayor
+mode_to_major_offset = {
+    "Ionian":     0,
+    "Dorian":    -2,
+    "Phrygian":  -4,
+    "Lydian":     5,
+    "Mixolydian": -7,
+    "Aeolian":   -9,
+    "Locrian":   -11
+}
+
+
+# Estrategia de enarmonización de este motor (parte de las claves de caché)
+SPELLING_STRATEGY = "key_signature"
+
+# Definición de cada modo (patrón de intervalos y rol de cada nota):
+# se carga de 'mode_definitions.json' y se compila en 'mode_registry'.
+mode_definitions = mode_registry.definitions
+
+
+# ---------------------------------------------
+# 2) FUNCIONES DE UTILIDAD
+# ---------------------------------------------
+def find_root_index(chromatic_scale, root_note):
+    """
+    Devuelve el índice (0-11) en 'chromatic_scale' donde se halle 'root_note'.
+    Si no lo encuentra, retorna None.
+    La búsqueda usa el índice precalculado de note_parser (O(1)) y acepta
+    cualquier pila de alteraciones, minúsculas y '♯'/'♭'.
+    """
+    return pitch_class(root_note)
+
+def _memo_root(root_note):
+    # Raíz canónica para las claves de caché ("g" y "G" comparten entrada)
+    try:
+        return parse_note(root_note).name
+    except ValueError:
+        return root_note
+
+
+@memoize(lambda root_note, mode: (_memo_root(root_note), mode, SPELLING_STRATEGY))
+def get_relative_major(root_note, mode):
+    """
+    Dado (root_note, mode), retorna la tónica de la 'escala mayor' relativa.
+    Ejemplo: get_relative_major("G", "Aeolian") -> "Bb".
+    """
+    root_index = find_root_index(chromatic_scale, root_note)
+    if root_index is None:
+        raise ValueError(f"Nota raíz inválida: {root_note}")
+
+    if mode not in mode_to_major_offset:
+        raise ValueError(f"Modo inválido: {mode}")
+
+    offset = mode_to_major_offset[mode] % 12
+    major_index = (root_index + offset) % 12
+
+    # De las enarmonías en major_index, elegimos la que esté en major_key_signatures_en
+    candidates = chromatic_scale[major_index]
+    for cand in candidates:
+        if cand in major_key_signatures_en:
+            return cand
+    # Fallback
+    return candidates[0]
+
+def pick_note_for_key_signature(candidates, key_sig):
+    """
+    Elige la enarmonía de 'candidates' más conveniente según 'key_sig'.
+      - key_sig > 0 => preferimos '#'
+      - key_sig < 0 => preferimos 'b'
+      - key_sig = 0 => preferimos notas naturales.
+    """
+    if key_sig < 0:
+        # Preferimos 'b'
+        for cand in candidates:
+            if "b" in cand and "#" not in cand:
+                return cand
+        return candidates[0]
+    elif key_sig > 0:
+        # Preferimos '#'
+        for cand in candidates:
+            if "#" in cand and "b" not in cand:
+                return cand
+        return candidates[0]
+    else:
+        # key_sig == 0 => preferimos forma natural
+        for cand in candidates:
+            if "#" not in cand and "b" not in cand:
+                return cand
+        return candidates[0]
+
+
+# ---------------------------------------------
+# 3) CALCULAR LA "ROOT SCALE" (OPCIONAL)
+# ---------------------------------------------
+@memoize(lambda root_note, mode: (_memo_root(root_note), mode, SPELLING_STRATEGY))
+def calculate_root_scale(root_note, mode):
+    """
+    (Esta función estaba antes en tu código. 
+     Puedes mantenerla si aún deseas usarla en otros lugares.
+     Pero para el enarmonizado fino, usaremos la lógica de get_relative_major.)
+    """
+    shift = mode_to_major_offset[mode] % 12
+    root_index = find_root_index(chromatic_scale, root_note)
+    if root_index is None:
+        raise ValueError(f"Nota raíz inválida: {root_note}.")
+
+    root_scale_index = (root_index + shift) % 12
+    # Elige la PRIMERA enarmonía
+    root_scale_note = chromatic_scale[root_scale_index][0]
+    return root_scale_note
+
+
+# ---------------------------------------------
+# 4) FUNCION PRINCIPAL PARA ESCALAS/MODOS
+# ---------------------------------------------
+def normalize_scale_key(root_note, mode, variation=None):
+    """
+    Devuelve la clave canónica (root_note, mode, variation) de una consulta.
+    La raíz se normaliza a su nombre canónico ("f♯" → "F#") y las
+    variaciones que el modo no define se descartan (variation=None),
+    igual que hace calculate_major_scale al construir la escala.
+    """
+    if mode not in mode_registry:
+        raise ValueError(f"Modo inválido: {mode}. Modos disponibles: {', '.join(mode_registry.modes())}")
+
+    try:
+        root_note = parse_note(root_note).name
+    except ValueError:
+        raise ValueError(f"Nota raíz inválida: {root_note}.") from None
+
+    if not mode_registry.has_variation(mode, variation):
+        variation = None
+    return (root_note, mode, variation)
+
+
+def _root_scale_code(root_note, compiled):
+    """
+    Código de enarmonía de la "root scale": la mayor relativa en los modos
+    diatónicos, la raíz de la escala padre en los modos de una familia
+    (p.ej. Ab para G Altered, de Ab Melodic minor) y la propia raíz en los
+    modos añadidos desde un archivo de definiciones (p.ej. un "Bebop").
+    """
+    family = compiled.family
+    if family is not None:
+        return spell_interval(root_note, family.parent_interval, family.parent_degree)
+    if compiled.mode in mode_to_major_offset:
+        return spelling_code(get_relative_major(root_note, compiled.mode))
+    return spelling_code(root_note)
+
+
+def _build_major_scale(root_note, mode, variation):
+    """
+    Construye la escala (o modo) desde 'root_note'. Cada nota se escribe con
+    la letra de su grado y la alteración que pide su distancia en semitonos
+    (speller.spell_scale_codes), así que las alteraciones coinciden con la
+    armadura de la mayor relativa sin buscar entre candidatos.
+    Se llama una sola vez por clave; los resultados viven en el catálogo.
+    """
+    # Modo (o variación) ya compilado: intervalos, grados y vector de roles
+    compiled = mode_registry.get(mode, variation)
+
+    # 1) Escribe cada grado aritméticamente
+    spellings = spell_scale_codes(root_note, compiled)
+
+    # 2) Como "root_scale", la mayor relativa (p.ej. "Bb" para G Aeolian) o la escala padre
+    return ScaleResult.from_codes(spellings, compiled.intervals, compiled.role_codes,
+                                  _root_scale_code(root_note, compiled))
+
+
+# Catálogo: (root_note, mode, variation, SPELLING_STRATEGY) → resultado compartido.
+# Se llena bajo demanda o de una vez con build_scale_catalog(). Sin límite por
+# defecto; enable_cache(maxsize) lo convierte en una LRU acotada.
+_scale_catalog = ScaleCache()
+
+# Tablas de grados: (mayor relativa, SPELLING_STRATEGY) → tupla de (modo, ScaleResult).
+# Los 7 modos de una tonalidad comparten la misma tabla.
+_degree_tables = ScaleCache()
+
+
+def calculate_major_scale(root_note, mode="Ionian", chord_scale_type="standard", variation=None,
+                          register=None, octaves=None):
+    """
+    Devuelve la escala (o modo) desde 'root_note' consultando el catálogo.
+    El resultado es un ScaleResult inmutable (se lee como el antiguo dict)
+    y se comparte entre todas las llamadas con la misma clave.
+
+    Si 'root_note' es un número MIDI, o se indica 'register' (octava, C4 = 60)
+    u 'octaves', devuelve en su lugar un array('B') con las alturas MIDI de la
+    escala en 'octaves' octavas (1 por defecto).
+    """
+    if register is not None or octaves is not None or isinstance(root_note, int):
+        compiled = mode_registry.get(mode, variation)
+        return midi_pitches(midi_root(root_note, register), compiled.mask, check_octaves(octaves))
+
+    result = _scale_catalog.get((root_note, mode, variation, SPELLING_STRATEGY))
+    if result is None:
+        key = normalize_scale_key(root_note, mode, variation)
+        cache_key = key + (SPELLING_STRATEGY,)
+        result = _scale_catalog.get(cache_key)
+        if result is None:
+            result = _build_major_scale(*key)
+            _scale_catalog.put(cache_key, result)
+    return result
+
+
+def build_scale_catalog():
+    """
+    Precalcula el catálogo completo: cada enarmonía de 'chromatic_scale'
+    en cada modo y cada variación. Útil para calentar el proceso al arrancar.
+    """
+    for names in chromatic_scale:
+        for root_note in names:
+            for compiled in mode_registry:
+                calculate_major_scale(root_note, compiled.mode, variation=compiled.variation)
+    return _scale_catalog
+
+
+# ---------------------------------------------
+# 5) CACHÉ OPCIONAL
+# ---------------------------------------------
+# Referencias fijas a las funciones memoizables (holygrail.instrumentation
+# puede reemplazar los nombres globales por versiones medidas)
+_memoized = (get_relative_major, calculate_root_scale)
+
+
+def enable_cache(maxsize=1024):
+    """
+    Activa la memoización acotada (LRU de 'maxsize' entradas por función) de
+    calculate_major_scale, calculate_modes_for_degrees, get_relative_major y
+    calculate_root_scale.
+    """
+    _scale_catalog.resize(maxsize)
+    _degree_tables.resize(maxsize)
+    _batch_rows.resize(maxsize)
+    for func in _memoized:
+        if func.cache is None:
+            func.cache = ScaleCache(maxsize)
+        else:
+            func.cache.resize(maxsize)
+
+
+def disable_cache():
+    """
+    Vuelve al comportamiento por defecto: catálogo sin límite y sin memoización
+    de get_relative_major ni calculate_root_scale.
+    """
+    _scale_catalog.resize(None)
+    _degree_tables.resize(None)
+    _batch_rows.resize(None)
+    for func in _memoized:
+        func.cache = None
+
+
+def invalidate_caches():
+    """
+    Vacía el catálogo y las cachés. Se llama sola cuando cambia mode_registry.
+    """
+    _scale_catalog.clear()
+    _degree_tables.clear()
+    _batch_rows.clear()
+    for func in _memoized:
+        if func.cache is not None:
+            func.cache.clear()
+
+
+def cache_stats():
+    """
+    Contadores de aciertos, fallos y desalojos de cada caché activa.
+    """
+    stats = {
+        "calculate_major_scale": _scale_catalog.stats(),
+        "calculate_modes_for_degrees": _degree_tables.stats(),
+        "calculate_scales_batch": _batch_rows.stats(),
+    }
+    for func in _memoized:
+        if func.cache is not None:
+            stats[func.__name__] = func.cache.stats()
+    return stats
+
+
+mode_registry.add_listener(invalidate_caches)
+
+
+# ---------------------------------------------
+# 6) CALCULAR MODOS DE CADA GRADO
+# ---------------------------------------------
+def _midi_modes_for_degrees(root_note, mode, register, octaves):
+    if mode not in mode_to_major_offset:
+        raise ValueError(f"Modo inválido: {mode}")
+    root_midi = midi_root(root_note, register)
+
+    # Tónica de la mayor relativa en o por debajo de la raíz, para que el grado
+    # de 'mode' empiece exactamente en root_midi
+    base_midi = root_midi - (-mode_to_major_offset[mode]) % 12
+    if base_midi < MIDI_MIN:
+        # La tabla empezaría por debajo de la nota 0: se sube entera una octava,
+        # así los grados siguen en orden ascendente
+        base_midi += 12
+    base_intervals = mode_registry.get("Ionian").intervals
+
+    degrees_modes = ["Ionian", "Dorian", "Phrygian", "Lydian", "Mixolydian", "Aeolian", "Locrian"]
+    modes = {}
+    for i, current_mode in enumerate(degrees_modes):
+        modes[current_mode] = midi_pitches(base_midi + base_intervals[i], mode_registry.get(current_mode).mask, octaves)
+    return modes
+
+
+def _build_degree_table(major_relative):
+    # Solo se construye la escala Ionian de la mayor relativa: cada grado se
+    # obtiene rotando sus clases de altura y sus enarmonías
+    base_scale = calculate_major_scale(major_relative, mode="Ionian")
+    base_spellings = base_scale.spelling_codes
+    base_index = pitch_class(major_relative)
+    base_pitch_classes = [(base_index + interval) % 12 for interval in base_scale.interval_codes]
+
+    degrees_modes = ["Ionian", "Dorian", "Phrygian", "Lydian", "Mixolydian", "Aeolian", "Locrian"]
+    table = []
+    for i, current_mode in enumerate(degrees_modes):
+        spellings = base_spellings[i:] + base_spellings[:i]
+        pitch_classes = base_pitch_classes[i:] + base_pitch_classes[:i]
+        intervals = tuple((pc - pitch_classes[0]) % 12 for pc in pitch_classes)
+
+        compiled = mode_registry.get(current_mode)
+        if compiled.intervals != intervals:
+            # El registro redefinió el modo: ya no es una rotación de Ionian
+            note = spelling_from_code(spellings[0]).name
+            result = calculate_major_scale(note, mode=current_mode)
+        else:
+            result = ScaleResult.from_codes(spellings, intervals, compiled.role_codes, spelling_code(major_relative))
+        table.append((current_mode, result))
+    return tuple(table)
+
+
+def calculate_modes_for_degrees(root_note, mode, register=None, octaves=None):
+    """
+    Calcula el modo de cada grado de la mayor relativa de (root_note, mode).
+    La tabla se construye una vez por mayor relativa (los 7 modos de una
+    tonalidad la comparten) rotando su escala Ionian, y se guarda en caché.
+    Devuelve {modo: ScaleResult}, en orden de grados.
+
+    Con un número MIDI, 'register' u 'octaves' devuelve {modo: array('B')}
+    de alturas MIDI, como calculate_major_scale.
+    """
+    if register is not None or octaves is not None or isinstance(root_note, int):
+        return _midi_modes_for_degrees(root_note, mode, register, check_octaves(octaves))
+
+    # Tonalidad mayor relativa (por ejemplo, "Bb" si pides G Aeolian)
+    major_relative = get_relative_major(root_note, mode)
+    key = (major_relative, SPELLING_STRATEGY)
+    table = _degree_tables.get(key)
+    if table is None:
+        table = _build_degree_table(major_relative)
+        _degree_tables.put(key, table)
+    return dict(table)
+
+
+# ---------------------------------------------
+# 7) CÁLCULO POR LOTES
+# ---------------------------------------------
+BATCH_PAD = -1  # relleno de las posiciones vacías en los arreglos por lotes
+
+# Filas por lotes: (root_note, mode, variation) tal como llegan → fila ya
+# rellenada a la anchura del registro. Se reutilizan entre llamadas y se
+# vacían junto al catálogo cuando cambia mode_registry.
+_batch_rows = ScaleCache()
+
+
+def batch_width():
+    """
+    Columnas por consulta en calculate_scales_batch: notas de la escala más larga del registro.
+    """
+    return max(len(compiled.intervals) for compiled in mode_registry)
+
+
+def _batch_row(root_note, mode, variation):
+    """
+    Fila de una consulta, como bytes de cada columna (en el formato de su
+    array): clases de altura, códigos de enarmonía y códigos de rol
+    (rellenados a batch_width()), largo, máscara y mayor relativa.
+    Las notas salen del catálogo de calculate_major_scale.
+    """
+    result = calculate_major_scale(root_note, mode, variation=variation)
+    intervals = result.interval_codes
+    pad = [BATCH_PAD] * (batch_width() - len(intervals))
+
+    root_index = pitch_class(root_note)
+    pitch_classes = [(root_index + interval) % 12 for interval in intervals]
+    return (
+        array("b", pitch_classes + pad).tobytes(),
+        array("h", list(result.spelling_codes) + pad).tobytes(),
+        array("b", list(result.role_codes) + pad).tobytes(),
+        array("B", [len(intervals)]).tobytes(),
+        array("H", [interval_mask(pitch_classes)]).tobytes(),
+        array("h", [result.root_scale_code]).tobytes(),
+    )
+
+
+# Columnas del resultado por lotes y tipo de su array, en el orden de _batch_row
+BATCH_COLUMNS = (
+    ("pitch_classes", "b"), ("spellings", "h"), ("roles", "b"),
+    ("lengths", "B"), ("masks", "H"), ("root_scales", "h"),
+)
+
+
+def calculate_scales_batch(roots, modes, variations=None):
+    """
+    Calcula muchas escalas de una vez.
+    'roots', 'modes' y 'variations' son secuencias del mismo largo; un solo
+    str en 'modes' o 'variations' se aplica a todas las consultas.
+    Cada consulta distinta se resuelve una sola vez (y su fila se guarda para
+    las llamadas siguientes); el resultado se arma uniendo filas ya hechas.
+
+    Devuelve arreglos planos (array) en orden fila por fila, 'width' columnas por consulta:
+      - pitch_classes: clases de altura 0-11 (BATCH_PAD en las columnas sobrantes)
+      - spellings:     códigos de enarmonía (note_parser.spelling_from_code)
+      - roles:         códigos de rol (mode_registry.ROLE_NAMES)
+      - lengths:       número de notas de cada escala
+      - masks:         máscara de 12 bits de las clases de altura de cada escala
+      - root_scales:   código de enarmonía de la mayor relativa
+    """
+    roots = list(roots)
+    size = len(roots)
+    if isinstance(modes, str) and (variations is None or isinstance(variations, str)):
+        # Un solo modo y variación: la raíz basta como clave
+        keys = roots
+        distinct = list(dict.fromkeys(keys))
+        queries = [(root_note, modes, variations) for root_note in distinct]
+    else:
+        modes = repeat(modes, size) if isinstance(modes, str) else modes
+        variations = repeat(variations, size) if variations is None or isinstance(variations, str) else variations
+        keys = list(zip(roots, modes, variations, strict=True))
+        distinct = queries = list(dict.fromkeys(keys))
+
+    # Cada consulta distinta se resuelve una vez (o sale de _batch_rows); cada
+    # columna se arma uniendo los bytes de sus filas, sin bucles en Python
+    rows = []
+    for query in queries:
+        row = _batch_rows.get(query)
+        if row is None:
+            row = _batch_row(*query)
+            _batch_rows.put(query, row)
+        rows.append(row)
+    index = {key: i for i, key in enumerate(distinct)}
+    ids = list(map(index.__getitem__, keys))
+    gather = itemgetter(*ids) if size > 1 else lambda column: tuple(column[i] for i in ids)
+
+    batch = {"size": size, "width": batch_width()}
+    for (name, typecode), column in zip(BATCH_COLUMNS, zip(*rows)):
+        batch[name] = array(typecode, b"".join(gather(column)))
+    for name, typecode in BATCH_COLUMNS:
+        batch.setdefault(name, array(typecode))
+    return batch
+
+
+# ---------------------------------------------
+# 8) BÚSQUEDA INVERSA: NOTAS → ESCALAS
+# ---------------------------------------------
+# Índices sobre las 4096 máscaras de clases de altura, construidos la primera
+# vez que se consultan (y de nuevo si cambia mode_registry):
+#   exact:      máscara → escalas cuyo conjunto de notas es exactamente la máscara
+#   containing: máscara → escalas que contienen todas las notas de la máscara
+_reverse_index = {"version": None, "exact": {}, "containing": {}}
+
+
+def _index_root_name(root_index):
+    # Enarmonía con armadura conocida (p.ej. "Bb" antes que "A#")
+    for cand in chromatic_scale[root_index]:
+        if cand in major_key_signatures_en:
+            return cand
+    return chromatic_scale[root_index][0]
+
+
+def _build_reverse_index():
+    exact = {}
+    containing = {}
+    for compiled in mode_registry:
+        for root_index in range(12):
+            entry = (_index_root_name(root_index), compiled.mode, compiled.variation)
+            mask = interval_mask(root_index + interval for interval in compiled.intervals)
+            exact.setdefault(mask, []).append(entry)
+
+            # Recorre todos los submask de 'mask'
+            subset = mask
+            while True:
+                containing.setdefault(subset, []).append(entry)
+                if subset == 0:
+                    break
+                subset = (subset - 1) & mask
+
+    _reverse_index["exact"] = {mask: tuple(entries) for mask, entries in exact.items()}
+    _reverse_index["containing"] = {mask: tuple(entries) for mask, entries in containing.items()}
+    _reverse_index["version"] = mode_registry.version
+
+
+def notes_to_mask(notes):
+    """
+    Máscara de 12 bits de una colección de notas (nombres o clases de altura 0-11).
+    """
+    mask = 0
+    for note in notes:
+        root_index = note % 12 if isinstance(note, int) else pitch_class(note)
+        if root_index is None:
+            raise ValueError(f"Nota inválida: {note}")
+        mask |= 1 << root_index
+    return mask
+
+
+def find_scales_containing(notes):
+    """
+    Devuelve todas las (root, mode, variation) cuya escala contiene 'notes'.
+    """
+    if _reverse_index["version"] != mode_registry.version:
+        _build_reverse_index()
+    return _reverse_index["containing"].get(notes_to_mask(notes), ())
+
+
+def find_exact_scales(notes):
+    """
+    Devuelve todas las (root, mode, variation) cuya escala tiene exactamente 'notes'.
+    """
+    if _reverse_index["version"] != mode_registry.version:
+        _build_reverse_index()
+    return _reverse_index["exact"].get(notes_to_mask(notes), ())
+
+
+# ---------------------------------------------
+# 9) ENUMERACIÓN DE TODAS LAS ESCALAS
+# ---------------------------------------------
+def iter_all_scales(roots=None, modes=None, variations=True, key_signatures_only=False):
+    """
+    Generador perezoso de (root_note, mode, variation, resultado) para cada
+    combinación soportada, siempre en el mismo orden:
+    enarmonías de 'chromatic_scale' (de C a B), modos en el orden del registro
+    y, dentro de cada modo, primero la forma base y luego sus variaciones.
+
+    Filtros opcionales:
+      - roots:               solo estas raíces (nombres en cualquier grafía)
+      - modes:               solo estos modos
+      - variations:          True = todas, False = ninguna, o una colección de nombres
+      - key_signatures_only: solo raíces que estén en 'major_key_signatures_en'
+    """
+    if roots is not None:
+        roots = {parse_note(root).name for root in roots}
+    if modes is not None:
+        modes = set(modes)
+
+    for names in chromatic_scale:
+        for root_note in names:
+            if roots is not None and root_note not in roots:
+                continue
+            if key_signatures_only and root_note not in major_key_signatures_en:
+                continue
+            for compiled in mode_registry:
+                if modes is not None and compiled.mode not in modes:
+                    continue
+                if compiled.variation is not None:
+                    if variations is False:
+                        continue
+                    if variations is not True and compiled.variation not in variations:
+                        continue
+                yield (
+                    root_note,
+                    compiled.mode,
+                    compiled.variation,
+                    calculate_major_scale(root_note, compiled.mode, variation=compiled.variation),
+                )
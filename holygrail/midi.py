@@ -0,0 +1,79 @@
+"""
+Salida en números MIDI: una escala se devuelve como un array('B') contiguo de
+alturas MIDI sobre N octavas, calculado a partir de la máscara de intervalos
+del modo compilado. No se escribe ni se analiza ningún nombre de nota.
+"""
+from array import array
+from bisect import bisect_right
+
+from .note_parser import NATURAL_PITCH_CLASSES, parse_note
+
+MIDI_MIN = 0
+MIDI_MAX = 127
+DEFAULT_REGISTER = 4  # octava del do central: C4 = 60
+DEFAULT_OCTAVES = 1
+MAX_OCTAVES = 11  # 11 octavas ya cubren todo el rango MIDI desde cualquier raíz
+
+# (máscara, octavas) → desplazamientos en semitonos desde la raíz, ordenados
+_offsets = {}
+
+
+def check_octaves(octaves):
+    """
+    Valida 'octaves' (None = DEFAULT_OCTAVES): un entero entre 1 y MAX_OCTAVES.
+    """
+    if octaves is None:
+        return DEFAULT_OCTAVES
+    if isinstance(octaves, bool) or not isinstance(octaves, int) or not 1 <= octaves <= MAX_OCTAVES:
+        raise ValueError(f"Número de octavas inválido: {octaves!r} (de 1 a {MAX_OCTAVES})")
+    return octaves
+
+
+def mask_offsets(mask, octaves=DEFAULT_OCTAVES):
+    """
+    Desplazamientos de todos los bits de 'mask' repetidos en 'octaves' octavas.
+    Se calculan una vez por (máscara, octavas).
+    """
+    octaves = check_octaves(octaves)
+    key = (mask, octaves)
+    offsets = _offsets.get(key)
+    if offsets is None:
+        intervals = [i for i in range(12) if mask >> i & 1]
+        offsets = tuple(12 * octave + interval for octave in range(octaves) for interval in intervals)
+        _offsets[key] = offsets
+    return offsets
+
+
+def midi_root(root_note, register=None):
+    """
+    Número MIDI de la raíz. 'root_note' puede ser ya un número MIDI o un nombre
+    de nota; en ese caso 'register' es la octava (notación científica, C4 = 60)
+    y la octava sigue a la letra: B#4 = 72, Cb4 = 59.
+    Un número MIDI ya fija la octava, así que no admite 'register'.
+    """
+    if isinstance(root_note, bool):
+        raise ValueError(f"Nota raíz inválida: {root_note!r}")
+    if isinstance(root_note, int):
+        if register is not None:
+            raise ValueError("'register' solo se aplica a nombres de nota, no a números MIDI")
+        number = root_note
+    else:
+        if isinstance(register, bool) or not isinstance(register, (int, type(None))):
+            raise ValueError(f"Registro inválido: {register!r}")
+        note = parse_note(root_note)
+        if register is None:
+            register = DEFAULT_REGISTER
+        number = 12 * (register + 1) + NATURAL_PITCH_CLASSES[note.letter] + note.accidental
+    if not MIDI_MIN <= number <= MIDI_MAX:
+        raise ValueError(f"Nota MIDI fuera de rango: {number}")
+    return number
+
+
+def midi_pitches(root_midi, mask, octaves=DEFAULT_OCTAVES):
+    """
+    array('B') con las alturas MIDI de 'mask' desde 'root_midi' en 'octaves'
+    octavas. Las alturas por encima de 127 se descartan.
+    """
+    offsets = mask_offsets(mask, octaves)
+    end = bisect_right(offsets, MIDI_MAX - root_midi)
+    return array("B", [root_midi + offset for offset in offsets[:end]])
@@ -0,0 +1,335 @@
+import json
+import os
+from collections import namedtuple
+
+# ---------------------------------------------
+# REGISTRO DE MODOS (CHORD SCALES) COMPILADOS
+# ---------------------------------------------
+# Las definiciones se leen de un archivo JSON (o TOML) con la misma forma que
+# el antiguo diccionario 'mode_definitions':
+#   { "Modo": { "pattern": [...], "roles": {"0": "Permitido", ...},
+#               "variations": { "nombre": { "pattern": [...], "roles": {...} } } } }
+# Cada modo y cada variación se compila una sola vez a:
+#   - mask:       máscara de 12 bits (bit i encendido si el intervalo i pertenece al modo)
+#   - avoid_mask: máscara de 12 bits con las notas "Evitado"
+#   - intervals:  intervalos ordenados (semitonos desde la raíz)
+#   - roles:      vector de roles alineado con 'intervals'
+#   - role_codes: el mismo vector como códigos enteros (índices en ROLE_NAMES)
+#   - degrees:    grado (1-7) de cada intervalo, que fija la letra al escribir la nota;
+#                 se deduce de los intervalos o se toma de "degrees" en el archivo
+#   - pattern:    patrón de distancias tal como viene en el archivo
+#   - family:     FamilyRotation si el modo se generó rotando una familia, o None
+#
+# Familias de escalas (scale_families.json): se declara un solo patrón padre y
+# cada rotación distinta se genera, se nombra y se compila como un modo más:
+#   { "Familia": { "pattern": [...], "modes": ["nombre de la rotación 1", ...],
+#                  "roles": { "nombre": {"1": "Evitado", ...} },
+#                  "degrees": { "nombre": [1, 2, 3, ...] } } }
+# "modes", "roles" y "degrees" son opcionales (nombres "Familia 2", ..., roles
+# y grados deducidos). En escalas de 7 notas el grado es la posición; en las
+# demás conviene declarar "degrees", porque infer_degrees no distingue, p. ej.,
+# #4/#5 (tonos enteros) de b5/b6.
+
+DEFAULT_DEFINITIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mode_definitions.json")
+DEFAULT_FAMILIES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scale_families.json")
+
+AVOID_ROLE = "Evitado"
+ALLOWED_ROLE = "Permitido"
+
+# Tabla de roles internados: el código de un rol es su posición en ROLE_NAMES
+ROLE_NAMES = []
+_role_codes = {}
+
+CompiledMode = namedtuple(
+    "CompiledMode",
+    ["mode", "variation", "mask", "avoid_mask", "intervals", "roles", "role_codes", "degrees", "pattern", "family"],
+)
+
+# Origen de un modo generado: familia, rotación (0 = escala padre) y posición
+# de la raíz de la escala padre respecto a la del modo (semitonos y grado)
+FamilyRotation = namedtuple("FamilyRotation", ["family", "rotation", "parent_interval", "parent_degree"])
+
+# Grado por defecto de cada intervalo (semitonos → grado 1-7)
+DEFAULT_DEGREES = {0: 1, 1: 2, 2: 2, 3: 3, 4: 3, 5: 4, 6: 4, 7: 5, 8: 6, 9: 6, 10: 7, 11: 7}
+
+
+def interval_mask(intervals):
+    """
+    Convierte una colección de intervalos (0-11) en una máscara de 12 bits.
+    """
+    mask = 0
+    for interval in intervals:
+        mask |= 1 << (interval % 12)
+    return mask
+
+
+def role_code(role):
+    """
+    Devuelve el código entero de 'role', registrándolo si es nuevo.
+    """
+    code = _role_codes.get(role)
+    if code is None:
+        code = _role_codes[role] = len(ROLE_NAMES)
+        ROLE_NAMES.append(role)
+    return code
+
+
+def infer_degrees(intervals):
+    """
+    Grado de cada intervalo de una escala:
+      - 3 semitonos es #9 (grado 2) si la escala también tiene tercera mayor
+      - 6 semitonos es #11 (grado 4) si hay quinta justa; si no, b5 (grado 5)
+    """
+    present = set(intervals)
+    degrees = []
+    for interval in intervals:
+        degree = DEFAULT_DEGREES[interval]
+        if interval == 3 and 4 in present:
+            degree = 2
+        elif interval == 6 and 7 not in present:
+            degree = 5
+        degrees.append(degree)
+    return tuple(degrees)
+
+
+def compile_mode(mode, variation, definition):
+    """
+    Compila la definición de un modo (o de una variación) a un CompiledMode.
+    """
+    roles = {}
+    for interval, role in definition["roles"].items():
+        interval = int(interval)
+        if not 0 <= interval < 12:
+            raise ValueError(f"Intervalo inválido en {mode} {variation or ''}: {interval}")
+        roles[interval] = role
+
+    intervals = tuple(sorted(roles))
+    avoid = [interval for interval in intervals if roles[interval] == AVOID_ROLE]
+    return CompiledMode(
+        mode=mode,
+        variation=variation,
+        mask=interval_mask(intervals),
+        avoid_mask=interval_mask(avoid),
+        intervals=intervals,
+        roles=tuple(roles[interval] for interval in intervals),
+        role_codes=tuple(role_code(roles[interval]) for interval in intervals),
+        degrees=tuple(definition["degrees"]) if "degrees" in definition else infer_degrees(intervals),
+        pattern=tuple(definition["pattern"]),
+        family=definition.get("family"),
+    )
+
+
+def rotation_roles(intervals):
+    """
+    Roles por defecto de un modo generado. En escalas de 7 notas, una tensión
+    (9, 11, 13) a un semitono por encima de una nota del acorde (1, 3, 5, 7)
+    es "Evitado"; en el resto de escalas todas las notas son "Permitido".
+    """
+    roles = {interval: ALLOWED_ROLE for interval in intervals}
+    if len(intervals) == 7:
+        chord_tones = {intervals[i] for i in (0, 2, 4, 6)}
+        for i in (1, 3, 5):
+            if (intervals[i] - 1) % 12 in chord_tones:
+                roles[intervals[i]] = AVOID_ROLE
+    return roles
+
+
+def expand_family(family, definition):
+    """
+    Definiciones (forma de mode_definitions) de cada rotación distinta del
+    patrón de 'family'. Las rotaciones repetidas de las escalas simétricas
+    (tonos enteros, disminuida, aumentada) se generan una sola vez.
+    """
+    pattern = list(definition["pattern"])
+    if sum(pattern) != 12:
+        raise ValueError(f"El patrón de la familia {family} no suma 12 semitonos: {pattern}")
+    names = definition.get("modes", [])
+    overrides = definition.get("roles", {})
+    declared_degrees = definition.get("degrees", {})
+    size = len(pattern)
+
+    modes, seen = {}, set()
+    for rotation in range(size):
+        rotated = pattern[rotation:] + pattern[:rotation]
+        if tuple(rotated) in seen:
+            continue
+        seen.add(tuple(rotated))
+
+        name = names[len(modes)] if len(modes) < len(names) else f"{family} {len(modes) + 1}"
+        intervals = [sum(rotated[:i]) for i in range(size)]
+        roles = rotation_roles(intervals)
+        roles.update({int(interval): role for interval, role in overrides.get(name, {}).items()})
+
+        parent_interval = -sum(pattern[:rotation]) % 12
+        if name in declared_degrees:
+            degrees = [int(degree) for degree in declared_degrees[name]]
+            if len(degrees) != size or not all(1 <= degree <= 7 for degree in degrees):
+                raise ValueError(f"Grados inválidos para {name} en la familia {family}: {degrees}")
+        elif size == 7:
+            # Cada letra una vez: el grado es la posición en la escala
+            degrees = list(range(1, 8))
+        else:
+            degrees = list(infer_degrees(intervals))
+        # La raíz de la escala padre se escribe con la misma letra que tiene dentro del modo
+        parent_degree = degrees[intervals.index(parent_interval)]
+        modes[name] = {
+            "pattern": rotated,
+            "roles": roles,
+            "degrees": degrees,
+            "family": FamilyRotation(family, rotation, parent_interval, parent_degree),
+        }
+    return modes
+
+
+def _read_file(path):
+    if path.endswith(".toml"):
+        import tomllib
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def read_families(path):
+    """
+    Lee un archivo de familias de escalas (.json o .toml).
+    """
+    return _read_file(path)
+
+
+def read_definitions(path):
+    """
+    Lee un archivo de definiciones (.json o .toml) y normaliza las claves
+    de 'roles' a enteros.
+    """
+    raw = _read_file(path)
+
+    def normalize(definition):
+        result = {
+            "pattern": list(definition["pattern"]),
+            "roles": {int(k): v for k, v in definition["roles"].items()},
+        }
+        if "degrees" in definition:
+            result["degrees"] = list(definition["degrees"])
+        if "variations" in definition:
+            result["variations"] = {name: normalize(var) for name, var in definition["variations"].items()}
+        return result
+
+    return {mode: normalize(definition) for mode, definition in raw.items()}
+
+
+class ModeRegistry:
+    """
+    Registro de modos y variaciones compilados a máscaras de bits.
+    'definitions' conserva la forma de 'mode_definitions' (claves enteras en 'roles').
+    'version' aumenta cada vez que cambian las definiciones, y se avisa a
+    las funciones registradas con add_listener (p.ej. para vaciar cachés).
+    """
+
+    def __init__(self, definitions=None):
+        self.definitions = {}
+        self.families = {}  # familia → nombres de los modos generados
+        self._compiled = {}
+        self._listeners = []
+        self.version = 0
+        if definitions:
+            self.update(definitions)
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_DEFINITIONS_PATH):
+        return cls(read_definitions(path))
+
+    def load(self, path):
+        """
+        Añade (o reemplaza) los modos definidos en otro archivo.
+        """
+        self.update(read_definitions(path))
+
+    def load_families(self, path=DEFAULT_FAMILIES_PATH):
+        """
+        Genera y añade los modos de las familias definidas en 'path'.
+        """
+        self.update_families(read_families(path))
+
+    def update_families(self, families):
+        definitions = {}
+        for family, definition in families.items():
+            modes = expand_family(family, definition)
+            self.families[family] = tuple(modes)
+            definitions.update(modes)
+        self.update(definitions)
+
+    def update(self, definitions):
+        compiled = {}
+        for mode, definition in definitions.items():
+            compiled[(mode, None)] = compile_mode(mode, None, definition)
+            for variation, var_definition in definition.get("variations", {}).items():
+                compiled[(mode, variation)] = compile_mode(mode, variation, var_definition)
+
+        # Si un modo se redefine, sus variaciones antiguas dejan de existir
+        for mode in definitions:
+            for key in [key for key in self._compiled if key[0] == mode]:
+                del self._compiled[key]
+        self.definitions.update(definitions)
+        self._compiled.update(compiled)
+        self.version += 1
+        for listener in self._listeners:
+            listener()
+
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def __contains__(self, mode):
+        return mode in self.definitions
+
+    def modes(self):
+        return list(self.definitions)
+
+    def variations(self, mode):
+        return list(self.definitions[mode].get("variations", {}))
+
+    def has_variation(self, mode, variation):
+        return (mode, variation) in self._compiled
+
+    def get(self, mode, variation=None):
+        """
+        Devuelve el CompiledMode de (mode, variation). Si la variación no existe
+        para ese modo, devuelve el modo base (igual que calculate_major_scale).
+        """
+        compiled = self._compiled.get((mode, variation))
+        if compiled is None:
+            if mode not in self.definitions:
+                raise ValueError(f"Modo inválido: {mode}. Modos disponibles: {', '.join(self.definitions)}")
+            compiled = self._compiled[(mode, None)]
+        return compiled
+
+    def __iter__(self):
+        return iter(self._compiled.values())
+
+    # --- Consultas con operaciones de bits ---
+    def contains(self, mode, interval, variation=None):
+        return bool(self.get(mode, variation).mask >> (interval % 12) & 1)
+
+    def is_avoid(self, mode, interval, variation=None):
+        return bool(self.get(mode, variation).avoid_mask >> (interval % 12) & 1)
+
+    def role(self, mode, interval, variation=None):
+        """
+        Rol ("Permitido", "Evitado", ...) del intervalo en el modo, o None si
+        el intervalo no pertenece al modo.
+        """
+        compiled = self.get(mode, variation)
+        interval %= 12
+        if not compiled.mask >> interval & 1:
+            return None
+        return ROLE_NAMES[compiled.role_codes[compiled.intervals.index(interval)]]
+
+    def is_subset(self, mask, mode, variation=None):
+        """
+        True si todos los intervalos de 'mask' pertenecen al modo.
+        """
+        return mask & ~self.get(mode, variation).mask == 0
+
+
+mode_registry = ModeRegistry.from_file()
+mode_registry.load_families()
@@ -0,0 +1,110 @@
+"""
+Tablas de nombres localizados (intervalos y roles).
+
+Los resultados solo guardan códigos; los nombres se resuelven al mostrar o
+serializar un resultado, en el idioma pedido. Cada idioma es un archivo
+holygrail/locales/<idioma>.json que se lee la primera vez que se usa y se
+guarda como tablas de cadenas internadas:
+  - "es":       nombres en español (por defecto)
+  - "en":       nombres en inglés
+  - "symbolic": formas cortas ("b9", "#11", "b13", ...)
+Los roles se traducen desde su nombre canónico (el de mode_definitions.json);
+un rol sin traducción se muestra tal cual.
+"""
+import json
+import os
+import sys
+from collections import namedtuple
+from collections.abc import Mapping
+
+from .mode_registry import ROLE_NAMES
+
+DEFAULT_LOCALE = "es"
+LOCALES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+
+# intervals: tupla indexada por semitonos (0-12); roles: nombre canónico → nombre localizado
+NameTable = namedtuple("NameTable", ["locale", "intervals", "roles", "unknown"])
+
+_tables = {}
+
+
+def available_locales():
+    return sorted(name[:-5] for name in os.listdir(LOCALES_DIR) if name.endswith(".json"))
+
+
+def _load_table(locale):
+    # Solo nombres exactos de archivos de LOCALES_DIR: "en", nunca "./en" ni "../locales/en"
+    # (el idioma llega de consultas del servidor y del stream, y es la clave de _tables)
+    locales = available_locales()
+    if locale not in locales:
+        raise ValueError(f"Idioma no disponible: {locale!r}. Disponibles: {', '.join(locales)}")
+    with open(os.path.join(LOCALES_DIR, f"{locale}.json"), encoding="utf-8") as f:
+        raw = json.load(f)
+
+    unknown = sys.intern(raw.get("unknown", "?"))
+    intervals = [unknown] * 13
+    for code, name in raw["intervals"].items():
+        intervals[int(code)] = sys.intern(name)
+    roles = {sys.intern(role): sys.intern(name) for role, name in raw.get("roles", {}).items()}
+    return NameTable(locale, tuple(intervals), roles, unknown)
+
+
+def name_table(locale=DEFAULT_LOCALE):
+    """
+    NameTable de 'locale', cargada la primera vez que se pide.
+    """
+    table = _tables.get(locale)
+    if table is None:
+        table = _tables[locale] = _load_table(locale)
+    return table
+
+
+def interval_names_for(codes, locale=DEFAULT_LOCALE):
+    """
+    Nombres de los intervalos 'codes' (semitonos) en 'locale'.
+    """
+    table = name_table(locale)
+    intervals, unknown = table.intervals, table.unknown
+    return tuple(intervals[code] if 0 <= code < len(intervals) else unknown for code in codes)
+
+
+def role_names_for(codes, locale=DEFAULT_LOCALE):
+    """
+    Nombres de los roles 'codes' (índices en ROLE_NAMES) en 'locale'.
+    """
+    roles = name_table(locale).roles
+    return tuple(roles.get(ROLE_NAMES[code], ROLE_NAMES[code]) for code in codes)
+
+
+def role_name(role, locale=DEFAULT_LOCALE):
+    """
+    Traducción de un rol por su nombre canónico ("Evitado" → "Avoid" en "en").
+    """
+    if role is None:
+        return None
+    return name_table(locale).roles.get(role, role)
+
+
+class IntervalNames(Mapping):
+    """
+    Vista de solo lectura {semitonos: nombre} de un idioma; la tabla se carga
+    en el primer acceso. Sustituye al antiguo diccionario 'interval_names'.
+    """
+
+    def __init__(self, locale=DEFAULT_LOCALE):
+        self.locale = locale
+
+    def __getitem__(self, code):
+        intervals = name_table(self.locale).intervals
+        if not isinstance(code, int) or not 0 <= code < len(intervals):
+            raise KeyError(code)
+        return intervals[code]
+
+    def __iter__(self):
+        return iter(range(len(name_table(self.locale).intervals)))
+
+    def __len__(self):
+        return len(name_table(self.locale).intervals)
+
+    def __repr__(self):
+        return f"IntervalNames({self.locale!r})"
@@ -0,0 +1,119 @@
+from collections import namedtuple
+
+# ---------------------------------------------
+# ANÁLISIS DE NOMBRES DE NOTA
+# ---------------------------------------------
+# Una nota se representa como (letter, accidental, pitch_class):
+#   - letter:      letra natural en mayúscula ("C" ... "B")
+#   - accidental:  alteración neta en semitonos (+1 = '#', -2 = 'bb', ...)
+#   - pitch_class: clase de altura 0-11 (C = 0)
+# Los nombres habituales se resuelven con un diccionario precalculado; el resto
+# (pilas de alteraciones largas como "F####") se calcula aritméticamente.
+
+NATURAL_PITCH_CLASSES = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+
+LETTERS = "CDEFGAB"
+
+ACCIDENTAL_VALUES = {
+    "#": 1, "♯": 1, "x": 2, "𝄪": 2,
+    "b": -1, "♭": -1, "𝄫": -2,
+}
+
+
+class ParsedNote(namedtuple("ParsedNote", ["letter", "accidental", "pitch_class"])):
+    __slots__ = ()
+
+    @property
+    def name(self):
+        """
+        Nombre canónico en ASCII: "F#", "Bb", "C##", ...
+        """
+        if self.accidental >= 0:
+            return self.letter + "#" * self.accidental
+        return self.letter + "b" * -self.accidental
+
+    def __str__(self):
+        return self.name
+
+
+def _parse_arithmetic(name):
+    if not isinstance(name, str) or not name:
+        return None
+    letter = name[0].upper()
+    if letter not in NATURAL_PITCH_CLASSES:
+        return None
+
+    accidental = 0
+    for char in name[1:]:
+        value = ACCIDENTAL_VALUES.get(char)
+        if value is None:
+            return None
+        accidental += value
+    return ParsedNote(letter, accidental, (NATURAL_PITCH_CLASSES[letter] + accidental) % 12)
+
+
+def _build_spelling_index(max_accidentals=3):
+    """
+    Precalcula nombre → ParsedNote para todas las letras (mayúscula y minúscula)
+    con hasta 'max_accidentals' sostenidos o bemoles, en ASCII y Unicode.
+    """
+    index = {}
+    for letter in LETTERS:
+        for count in range(max_accidentals + 1):
+            for sharp, flat in (("#", "b"), ("♯", "♭")):
+                for spelling in (letter + sharp * count, letter + flat * count):
+                    index[spelling] = _parse_arithmetic(spelling)
+                    index[letter.lower() + spelling[1:]] = index[spelling]
+    return index
+
+
+_spelling_index = _build_spelling_index()
+
+
+def parse_note(name):
+    """
+    Devuelve el ParsedNote de 'name'. Acepta ParsedNote ya calculados,
+    minúsculas, '#'/'b', '♯'/'♭' y pilas de alteraciones de cualquier largo.
+    Lanza ValueError si el nombre no es una nota válida.
+    """
+    if isinstance(name, ParsedNote):
+        return name
+    parsed = _spelling_index.get(name) if isinstance(name, str) else None
+    if parsed is None:
+        parsed = _parse_arithmetic(name)
+        if parsed is None:
+            raise ValueError(f"Nota inválida: {name}")
+    return parsed
+
+
+def pitch_class(name):
+    """
+    Devuelve la clase de altura (0-11) de 'name', o None si no es válida.
+    """
+    parsed = _spelling_index.get(name) if isinstance(name, str) else None
+    if parsed is None:
+        try:
+            parsed = parse_note(name)
+        except ValueError:
+            return None
+    return parsed.pitch_class
+
+
+def spelling_code(name):
+    """
+    Codifica una enarmonía en un entero pequeño: (índice de letra << 4) | (alteración + 8).
+    Admite alteraciones entre -8 y +7.
+    """
+    parsed = parse_note(name)
+    if not -8 <= parsed.accidental <= 7:
+        raise ValueError(f"Alteración fuera de rango para codificar: {name}")
+    return LETTERS.index(parsed.letter) << 4 | (parsed.accidental + 8)
+
+
+def spelling_from_code(code):
+    """
+    Inverso de spelling_code: devuelve el ParsedNote correspondiente.
+    """
+    letter = LETTERS[code >> 4]
+    accidental = (code & 0xF) - 8
+    return ParsedNote(letter, accidental, (NATURAL_PITCH_CLASSES[letter] + accidental) % 12)
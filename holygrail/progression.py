@@ -0,0 +1,174 @@
+"""
+Progresiones de acordes → chord scales.
+
+Cada cifrado (p.ej. "G7(b9,b13)", "Cmaj7", "Dm7", "G7sus4") se traduce a un
+(modo, variación) de mode_registry. Los resultados se guardan por cifrado,
+así que un acorde repetido en un tema o en un corpus se resuelve una sola vez.
+"""
+import re
+from collections import namedtuple
+
+from . import get_engine, DEFAULT_SPELLING
+from .mode_registry import interval_mask, mode_registry
+from .note_parser import parse_note
+from .scale_cache import ScaleCache
+
+# 'error' solo se rellena con analyze_progression(..., errors="keep"): el
+# cifrado no se reconoció y el resto de campos (salvo 'symbol') son None
+ChordScale = namedtuple("ChordScale", ["symbol", "root", "mode", "variation", "scale", "error"],
+                        defaults=(None,))
+
+# Sufijo del cifrado → (intervalos del acorde, modo por defecto, variación)
+CHORD_QUALITIES = {
+    "":              ((0, 4, 7), "Ionian", None),
+    "maj":           ((0, 4, 7), "Ionian", None),
+    "6":             ((0, 4, 7, 9), "Ionian", None),
+    "maj7":          ((0, 4, 7, 11), "Ionian", None),
+    "M7":            ((0, 4, 7, 11), "Ionian", None),
+    "Δ":             ((0, 4, 7, 11), "Ionian", None),
+    "Δ7":            ((0, 4, 7, 11), "Ionian", None),
+    "maj9":          ((0, 2, 4, 7, 11), "Ionian", None),
+    "69":            ((0, 2, 4, 7, 9), "Ionian", None),
+    "6/9":           ((0, 2, 4, 7, 9), "Ionian", None),
+    "add9":          ((0, 2, 4, 7), "Ionian", None),
+    "maj7#11":       ((0, 4, 6, 7, 11), "Lydian", None),
+    "Δ#11":          ((0, 4, 6, 7, 11), "Lydian", None),
+    "maj7#5":        ((0, 4, 8, 11), "Lydian augmented", None),
+    "Δ#5":           ((0, 4, 8, 11), "Lydian augmented", None),
+    "m":             ((0, 3, 7), "Dorian", None),
+    "-":             ((0, 3, 7), "Dorian", None),
+    "m6":            ((0, 3, 7, 9), "Dorian", None),
+    "m7":            ((0, 3, 7, 10), "Dorian", None),
+    "-7":            ((0, 3, 7, 10), "Dorian", None),
+    "min7":          ((0, 3, 7, 10), "Dorian", None),
+    "m9":            ((0, 2, 3, 7, 10), "Dorian", None),
+    "m11":           ((0, 3, 5, 7, 10), "Dorian", None),
+    "m7b9":          ((0, 1, 3, 7, 10), "Phrygian", None),
+    "m(b6)":         ((0, 3, 7, 8), "Aeolian", None),
+    "m(maj7)":       ((0, 3, 7, 11), "Melodic minor", None),
+    "mmaj7":         ((0, 3, 7, 11), "Melodic minor", None),
+    "mM7":           ((0, 3, 7, 11), "Melodic minor", None),
+    "-Δ7":           ((0, 3, 7, 11), "Melodic minor", None),
+    "dim":           ((0, 3, 6), "Locrian", None),
+    "°":             ((0, 3, 6), "Locrian", None),
+    "o":             ((0, 3, 6), "Locrian", None),
+    "dim7":          ((0, 3, 6, 9), "Whole-half diminished", None),
+    "°7":            ((0, 3, 6, 9), "Whole-half diminished", None),
+    "o7":            ((0, 3, 6, 9), "Whole-half diminished", None),
+    "aug":           ((0, 4, 8), "Whole tone", None),
+    "+":             ((0, 4, 8), "Whole tone", None),
+    "7#5":           ((0, 4, 8, 10), "Whole tone", None),
+    "aug7":          ((0, 4, 8, 10), "Whole tone", None),
+    "+7":            ((0, 4, 8, 10), "Whole tone", None),
+    "m7b5":          ((0, 3, 6, 10), "Locrian", None),
+    "ø":             ((0, 3, 6, 10), "Locrian", None),
+    "ø7":            ((0, 3, 6, 10), "Locrian", None),
+    "7":             ((0, 4, 7, 10), "Mixolydian", None),
+    "9":             ((0, 2, 4, 7, 10), "Mixolydian", None),
+    "13":            ((0, 4, 7, 9, 10), "Mixolydian", None),
+    "sus4":          ((0, 5, 7), "Mixolydian", "sus4"),
+    "7sus4":         ((0, 5, 7, 10), "Mixolydian", "sus4"),
+    "9sus4":         ((0, 2, 5, 7, 10), "Mixolydian", "sus4"),
+    "7#11":          ((0, 4, 6, 7, 10), "Lydian dominant", None),
+    "9#11":          ((0, 2, 4, 6, 7, 10), "Lydian dominant", None),
+    "7b13":          ((0, 4, 7, 8, 10), "Mixolydian b6", None),
+    "7b9":           ((0, 1, 4, 7, 10), "Mixolydian", "7(b9,b13)"),
+    "7b9b13":        ((0, 1, 4, 8, 10), "Mixolydian", "7(b9,b13)"),
+    "7#9":           ((0, 3, 4, 7, 10), "Mixolydian", "7(b9,#9,b13)"),
+    "7b9#9":         ((0, 1, 3, 4, 7, 10), "Mixolydian", "7(b9,#9,b13)"),
+    "7#9b13":        ((0, 3, 4, 8, 10), "Mixolydian", "7(b9,#9,b13)"),
+    "7(b9,b13)":     ((0, 1, 4, 8, 10), "Mixolydian", "7(b9,b13)"),
+    "7(b9,#9,b13)":  ((0, 1, 3, 4, 8, 10), "Mixolydian", "7(b9,#9,b13)"),
+    "7alt":          ((0, 1, 3, 4, 6, 8, 10), "Mixolydian", "7b5(b9,#9,b13)"),
+    "7b5(b9,#9,b13)": ((0, 1, 3, 4, 6, 8, 10), "Mixolydian", "7b5(b9,#9,b13)"),
+    "7(b9,#9,#11,13)": ((0, 1, 3, 4, 6, 9, 10), "Mixolydian", "7(b9,#9,#11,13)"),
+}
+
+# Grado de la tonalidad mayor (semitonos desde la tónica) → modo diatónico
+DIATONIC_MODES = {0: "Ionian", 2: "Dorian", 4: "Phrygian", 5: "Lydian", 7: "Mixolydian", 9: "Aeolian", 11: "Locrian"}
+
+_ROOT_PATTERN = re.compile(r"^([A-Ga-g][#b♯♭]*)(.*)$")
+
+# Caché por (cifrado, tonalidad, estrategia)
+_chord_cache = ScaleCache()
+mode_registry.add_listener(_chord_cache.clear)
+
+
+def parse_chord_symbol(symbol):
+    """
+    Separa un cifrado en (ParsedNote de la raíz, sufijo). El bajo de los
+    acordes con barra ("C7/E") se valida y se ignora. Un sufijo que ya
+    contiene la barra ("6/9") tiene prioridad: "C6/9" es C6/9, no C6 con
+    bajo en 9; "C6/9/E" es C6/9 con bajo en E.
+    """
+    match = _ROOT_PATTERN.match(symbol.strip())
+    if match is None:
+        raise ValueError(f"Acorde no reconocido: {symbol}")
+    root, suffix = match.groups()
+    if suffix not in CHORD_QUALITIES:
+        suffix, slash, bass = suffix.rpartition("/")
+        if not slash or suffix not in CHORD_QUALITIES:
+            raise ValueError(f"Acorde no reconocido: {symbol}")
+        try:
+            parse_note(bass)
+        except ValueError:
+            raise ValueError(f"Bajo no reconocido en el acorde: {symbol}") from None
+    return parse_note(root), suffix
+
+
+def _resolve_chord(symbol, key, spelling):
+    root, suffix = parse_chord_symbol(symbol)
+    chord_intervals, mode, variation = CHORD_QUALITIES[suffix]
+
+    # Con tonalidad: un acorde diatónico toma el modo de su grado si contiene sus notas
+    if key is not None and variation is None:
+        degree_mode = DIATONIC_MODES.get((root.pitch_class - parse_note(key).pitch_class) % 12)
+        if degree_mode is not None and mode_registry.is_subset(interval_mask(chord_intervals), degree_mode):
+            mode = degree_mode
+
+    scale = get_engine(spelling).calculate_major_scale(root.name, mode, variation=variation)
+    return ChordScale(symbol, root.name, mode, variation, scale)
+
+
+def chord_scale(symbol, key=None, spelling=DEFAULT_SPELLING):
+    """
+    Devuelve el ChordScale de un cifrado. 'key' (tónica mayor, opcional)
+    permite elegir el modo diatónico del grado: Em7 en C → Phrygian.
+    """
+    cache_key = (symbol, key, spelling)
+    result = _chord_cache.get(cache_key)
+    if result is None:
+        result = _resolve_chord(symbol, key, spelling)
+        _chord_cache.put(cache_key, result)
+    return result
+
+
+def split_progression(text):
+    """
+    Divide una progresión en cifrados; las barras de compás '|' se ignoran.
+    """
+    return [token for token in text.replace("|", " ").split() if token]
+
+
+def analyze_progression(text, key=None, spelling=DEFAULT_SPELLING, errors="raise"):
+    """
+    Asigna una chord scale a cada acorde de 'text'. Devuelve una lista de ChordScale.
+    Con errors="raise" un cifrado desconocido lanza ValueError; con
+    errors="keep" ese acorde se devuelve como ChordScale(symbol, ..., error=mensaje)
+    y se sigue con el resto (útil para procesar un corpus entero).
+    """
+    if errors not in ("raise", "keep"):
+        raise ValueError(f"Valor de 'errors' inválido: {errors}. Valores: raise, keep")
+    chords = []
+    for symbol in split_progression(text):
+        try:
+            chords.append(chord_scale(symbol, key, spelling))
+        except ValueError as exc:
+            if errors == "raise":
+                raise
+            chords.append(ChordScale(symbol, None, None, None, None, str(exc)))
+    return chords
+
+
+def chord_cache_stats():
+    return _chord_cache.stats()
@@ -0,0 +1,106 @@
+from collections import OrderedDict
+from functools import wraps
+
+# ---------------------------------------------
+# CACHÉ ACOTADA (LRU) CON ESTADÍSTICAS
+# ---------------------------------------------
+# - hits:      consultas resueltas desde la caché
+# - misses:    valores calculados y guardados (cada put es un fallo previo)
+# - evictions: entradas descartadas por superar 'maxsize'
+# maxsize=None significa sin límite (sin desalojo ni reordenamiento LRU).
+
+_MISSING = object()
+
+
+class ScaleCache:
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        self.hits += 1
+        if self.maxsize is not None:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                # Desalojada entre tanto por otro hilo (HolyGrailServer resuelve lotes en un hilo aparte)
+                pass
+        return value
+
+    def put(self, key, value):
+        self.misses += 1
+        self._data[key] = value
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def resize(self, maxsize):
+        """
+        Cambia el límite; si el nuevo es menor, desaloja las entradas más antiguas.
+        """
+        self.maxsize = maxsize
+        if maxsize is not None:
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        if self._data:
+            self.invalidations += 1
+        self._data.clear()
+
+    def values(self):
+        return self._data.values()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+
+def memoize(key_func):
+    """
+    Decorador de memoización opcional: mientras 'wrapper.cache' sea None la
+    función se llama directamente; al asignarle un ScaleCache, los resultados
+    se guardan bajo key_func(*args, **kwargs).
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = wrapper.cache
+            if cache is None:
+                return func(*args, **kwargs)
+            key = key_func(*args, **kwargs)
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper.cache = None
+        return wrapper
+    return decorator
@@ -0,0 +1,137 @@
+from collections.abc import Mapping
+
+from .names import DEFAULT_LOCALE, IntervalNames, interval_names_for, role_names_for
+from .note_parser import spelling_code, spelling_from_code
+
+# ---------------------------------------------
+# RESULTADO COMPACTO DE UNA ESCALA
+# ---------------------------------------------
+# Un ScaleResult guarda un único 'bytes' inmutable con el formato:
+#   [n, mayor relativa, n códigos de enarmonía, n intervalos, n códigos de rol]
+# Los nombres (notas, intervalos y roles en el idioma pedido) solo se resuelven
+# al leerlos, así que una escala de 7 notas ocupa unas decenas de bytes.
+
+# Nombres de los intervalos (en semitonos desde la raíz) en el idioma por defecto;
+# se cargan de holygrail/locales en el primer acceso
+interval_names = IntervalNames(DEFAULT_LOCALE)
+
+RESULT_KEYS = ("notes", "intervals", "roles", "root_scale")
+
+
+def _as_tuple(value):
+    return tuple(value) if isinstance(value, list) else value
+
+
+class ScaleResult(Mapping):
+    """
+    Escala calculada, guardada como códigos enteros.
+    Es un Mapping de solo lectura con las claves del antiguo dict ("notes",
+    "intervals", "roles", "root_scale"): result["notes"], "notes" in result,
+    result.get(...), items(), dict(result). Para JSON: json.dumps(result.to_dict()).
+    Los valores son tuplas, pero un ScaleResult es igual al antiguo dict de
+    listas con los mismos nombres (result == {"notes": [...], ...}).
+    """
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        self._data = bytes(data)
+
+    @classmethod
+    def pack(cls, notes, interval_codes, role_codes, root_scale):
+        return cls.from_codes([spelling_code(note) for note in notes], interval_codes, role_codes, spelling_code(root_scale))
+
+    @classmethod
+    def from_codes(cls, spelling_codes, interval_codes, role_codes, root_scale_code):
+        return cls([len(spelling_codes), root_scale_code, *spelling_codes, *interval_codes, *role_codes])
+
+    def _codes(self, part):
+        data = self._data
+        start = 2 + part * data[0]
+        return tuple(data[start:start + data[0]])
+
+    # --- Códigos (sin conversión a texto) ---
+    @property
+    def spelling_codes(self):
+        return self._codes(0)
+
+    @property
+    def interval_codes(self):
+        return self._codes(1)
+
+    @property
+    def role_codes(self):
+        return self._codes(2)
+
+    @property
+    def root_scale_code(self):
+        return self._data[1]
+
+    def to_bytes(self):
+        return self._data
+
+    # --- Vistas legibles, resueltas al leer ---
+    @property
+    def notes(self):
+        return tuple(spelling_from_code(code).name for code in self.spelling_codes)
+
+    @property
+    def intervals(self):
+        return interval_names_for(self.interval_codes)
+
+    @property
+    def roles(self):
+        return role_names_for(self.role_codes)
+
+    @property
+    def root_scale(self):
+        return spelling_from_code(self._data[1]).name
+
+    # --- Protocolo Mapping ---
+    def __getitem__(self, key):
+        if key not in RESULT_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(RESULT_KEYS)
+
+    def __len__(self):
+        return len(RESULT_KEYS)
+
+    def __contains__(self, key):
+        return key in RESULT_KEYS
+
+    def __eq__(self, other):
+        if isinstance(other, ScaleResult):
+            return self._data == other._data
+        if isinstance(other, Mapping):
+            # Listas y tuplas con los mismos nombres son equivalentes (el antiguo dict usaba listas)
+            return len(other) == len(RESULT_KEYS) and all(
+                key in other and _as_tuple(other[key]) == getattr(self, key) for key in RESULT_KEYS
+            )
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._data)
+
+    def __reduce__(self):
+        return (ScaleResult, (self._data,))
+
+    def to_dict(self, locale=None):
+        """
+        Dict con los nombres resueltos; 'locale' elige el idioma de intervalos
+        y roles ("es", "en", "symbolic"; por defecto "es").
+        """
+        if locale is None or locale == DEFAULT_LOCALE:
+            return {key: getattr(self, key) for key in RESULT_KEYS}
+        return {
+            "notes": self.notes,
+            "intervals": interval_names_for(self.interval_codes, locale),
+            "roles": role_names_for(self.role_codes, locale),
+            "root_scale": self.root_scale,
+        }
+
+    def __repr__(self):
+        return f"ScaleResult(notes={self.notes}, root_scale={self.root_scale!r})"
+
+    __str__ = __repr__
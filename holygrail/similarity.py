@@ -0,0 +1,400 @@
+"""
+Matriz de similitud entre todas las escalas (raíz, modo, variación).
+
+Cada escala es una máscara de 12 bits de clases de altura (raíz 0-11 × cada
+entrada de mode_registry). Para cada par se guardan tres medidas, en matrices
+densas N × N de bytes (array('B'), N = 12 × entradas del registro):
+  - common_tones:  notas en común (más es más parecido)
+  - hamming:       notas que están en una sola de las dos escalas
+  - voice_leading: desplazamiento mínimo, en semitonos, para llevar las
+                   notas de una escala a las de la otra (cada nota de ambas
+                   escalas debe usarse; si difieren en número de notas,
+                   alguna nota de la menor se desdobla)
+La conducción de voces solo depende de los patrones y de la distancia entre
+raíces, así que se calcula una vez por (patrón, patrón, transposición).
+
+La matriz se construye la primera vez que se pide y queda en memoria. Solo
+se guarda en disco si se indica un directorio (similarity_matrix(cache_dir)
+o HOLYGRAIL_CACHE_DIR; USER_CACHE_DIR es el sugerido), en un archivo cuyo
+nombre incluye la huella de mode_registry; cambiar el registro la invalida.
+Las raíces de los resultados se escriben con el nombre canónico de su clase
+de altura, salvo la de la consulta, que conserva la enarmonía pedida.
+
+Consultas:
+  - nearest(root, mode, variation, k):  las k escalas más cercanas
+  - modulation_path(origen, destino):   camino de menor coste entre dos
+                                        escalas dando pasos pequeños
+"""
+import hashlib
+import heapq
+import os
+import struct
+from array import array
+from collections import namedtuple
+from itertools import combinations_with_replacement
+
+from .key_signature import _index_root_name
+from .mode_registry import interval_mask, mode_registry
+from .note_parser import parse_note, pitch_class
+
+Scale = namedtuple("Scale", ["root", "mode", "variation"])
+Neighbor = namedtuple("Neighbor", ["root", "mode", "variation", "distance"])
+
+METRICS = ("voice_leading", "hamming", "common_tones")
+DEFAULT_METRIC = "voice_leading"
+# Sin directorio (None) la matriz solo vive en memoria: escribir en disco es opcional
+DEFAULT_CACHE_DIR = os.environ.get("HOLYGRAIL_CACHE_DIR") or None
+USER_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "holygrail")
+
+# Formato del archivo (little-endian):
+#   cabecera  SIM_HEADER (magic, versión, claves, tamaño de strings, huella)
+#   strings   modos y variaciones ("" = sin variación) separados por NUL
+#   masks     H × K máscaras de los patrones (raíz 0)
+#   matrices  B × N×N, en el orden de METRICS
+MAGIC = b"HGSIMIL\0"
+FORMAT_VERSION = 1
+SIM_HEADER = struct.Struct("<8sHII16s")
+
+
+# ---------------------------------------------
+# DISTANCIAS ENTRE CONJUNTOS DE CLASES DE ALTURA
+# ---------------------------------------------
+def _pitch_classes(mask):
+    return [pc for pc in range(12) if mask >> pc & 1]
+
+
+def _circular(a, b):
+    d = abs(a - b) % 12
+    return min(d, 12 - d)
+
+
+def voice_leading_distance(mask_a, mask_b):
+    """
+    Suma mínima de semitonos que se mueven las voces para pasar de 'mask_a'
+    a 'mask_b' (máscaras de clases de altura). En el círculo, el emparejamiento
+    óptimo de dos conjuntos ordenados del mismo tamaño es un desplazamiento
+    cíclico; con tamaños distintos se prueban los desdoblamientos de la menor.
+    """
+    a, b = _pitch_classes(mask_a), _pitch_classes(mask_b)
+    if not a or not b:
+        raise ValueError("Conjunto de notas vacío")
+    if len(a) > len(b):
+        a, b = b, a
+    size = len(b)
+    best = None
+    for doubled in combinations_with_replacement(a, size - len(a)):
+        voices = sorted(a + list(doubled))
+        for shift in range(size):
+            total = 0
+            for i, pc in enumerate(voices):
+                total += _circular(pc, b[(i + shift) % size])
+                if best is not None and total >= best:
+                    break
+            else:
+                best = total
+    return best
+
+
+# ---------------------------------------------
+# MATRIZ
+# ---------------------------------------------
+def registry_fingerprint(registry=mode_registry):
+    """
+    Huella (16 bytes) de las claves y patrones del registro.
+    """
+    digest = hashlib.sha256()
+    for compiled in registry:
+        digest.update(f"{compiled.mode}\0{compiled.variation or ''}\0{compiled.mask}\n".encode("utf-8"))
+    return digest.digest()[:16]
+
+
+class SimilarityMatrix:
+    """
+    Distancias entre todas las escalas. La fila de (raíz, clave k) es
+    raíz × claves + k; 'keys' son los pares (modo, variación) del registro.
+    """
+
+    def __init__(self, keys, masks, common_tones, hamming, voice_leading, fingerprint):
+        self.keys = keys
+        self.masks = masks
+        self.common_tones = common_tones
+        self.hamming = hamming
+        self.voice_leading = voice_leading
+        self.fingerprint = fingerprint
+        self._key_index = {key: i for i, key in enumerate(keys)}
+        self._modes = {mode for mode, _ in keys}
+        self._adjacencies = {}
+
+    @classmethod
+    def build(cls, registry=mode_registry):
+        keys = [(compiled.mode, compiled.variation) for compiled in registry]
+        masks = array("H", (compiled.mask for compiled in registry))
+        n_keys = len(keys)
+        size = 12 * n_keys
+
+        # Conducción de voces por (patrón, patrón, transposición): sin repetir cálculos
+        distances = {}
+        rotated = [[interval_mask(interval + shift for interval in compiled.intervals) for shift in range(12)]
+                   for compiled in registry]
+        common_tones, hamming, voice_leading = (array("B", bytes(size * size)) for _ in METRICS)
+        for ka in range(n_keys):
+            mask_a = masks[ka]
+            for kb in range(n_keys):
+                for shift in range(12):
+                    mask_b = rotated[kb][shift]
+                    vl = distances.get((mask_a, mask_b))
+                    if vl is None:
+                        vl = distances[(mask_a, mask_b)] = voice_leading_distance(mask_a, mask_b)
+                    common = (mask_a & mask_b).bit_count()
+                    differ = (mask_a ^ mask_b).bit_count()
+                    # Misma relación para cualquier par de raíces separadas por 'shift'
+                    for root_a in range(12):
+                        i = (root_a * n_keys + ka) * size + ((root_a + shift) % 12) * n_keys + kb
+                        common_tones[i] = common
+                        hamming[i] = differ
+                        voice_leading[i] = vl
+        return cls(keys, masks, common_tones, hamming, voice_leading, registry_fingerprint(registry))
+
+    def __len__(self):
+        return 12 * len(self.keys)
+
+    # --- archivo ---------------------------------------------------------
+    def save(self, path):
+        """
+        Escribe la matriz en 'path' (reemplazo atómico).
+        """
+        strings = "\0".join([mode for mode, _ in self.keys] + [variation or "" for _, variation in self.keys])
+        strings = strings.encode("utf-8")
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        with open(tmp_path, "wb") as f:
+            f.write(SIM_HEADER.pack(MAGIC, FORMAT_VERSION, len(self.keys), len(strings), self.fingerprint))
+            f.write(strings)
+            f.write(self.masks.tobytes())
+            for metric in METRICS:
+                f.write(getattr(self, metric).tobytes())
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, n_keys, strings_size, fingerprint = SIM_HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"No es una matriz de similitud de HolyGrail: {path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Versión de matriz no soportada: {version} (se esperaba {FORMAT_VERSION})")
+        pos = SIM_HEADER.size
+        strings = data[pos:pos + strings_size].decode("utf-8").split("\0")
+        pos += strings_size
+        keys = list(zip(strings[:n_keys], [name or None for name in strings[n_keys:]]))
+
+        masks = array("H")
+        masks.frombytes(data[pos:pos + 2 * n_keys])
+        pos += 2 * n_keys
+        cells = (12 * n_keys) ** 2
+        if len(data) != pos + len(METRICS) * cells:
+            raise ValueError(f"Matriz de similitud truncada: {path}")
+        matrices = {}
+        for metric in METRICS:
+            matrices[metric] = array("B")
+            matrices[metric].frombytes(data[pos:pos + cells])
+            pos += cells
+        return cls(keys, masks, fingerprint=fingerprint, **matrices)
+
+    # --- consultas -------------------------------------------------------
+    def index(self, root_note, mode, variation=None):
+        """
+        Fila de (root_note, mode, variation); las variaciones desconocidas se
+        tratan como None, igual que en calculate_major_scale.
+        """
+        root = pitch_class(root_note)
+        if root is None:
+            raise ValueError(f"Nota raíz inválida: {root_note}.")
+        key = self._key_index.get((mode, variation))
+        if key is None:
+            if mode not in self._modes:
+                raise ValueError(f"Modo inválido: {mode}")
+            key = self._key_index[(mode, None)]
+        return root * len(self.keys) + key
+
+    def scale(self, i, root_names=None):
+        """
+        Scale de la fila 'i'. 'root_names' ({clase de altura: nombre}) fija la
+        enarmonía de algunas raíces; el resto usa el nombre canónico.
+        """
+        root, key = divmod(i, len(self.keys))
+        name = root_names.get(root) if root_names else None
+        return Scale(name or _index_root_name(root), *self.keys[key])
+
+    def _caller_names(self, *scales):
+        # {clase de altura: nombre} de las raíces que dio el llamador (tuplas, no índices)
+        names = {}
+        for scale in scales:
+            if not isinstance(scale, int):
+                root = parse_note(scale[0])
+                names[root.pitch_class] = root.name
+        return names
+
+    def _row(self, metric):
+        if metric not in METRICS:
+            raise ValueError(f"Métrica inválida: {metric}. Métricas: {', '.join(METRICS)}")
+        return getattr(self, metric)
+
+    def _resolve(self, scale):
+        # Fila de un índice o de una tupla (raíz, modo[, variación])
+        return scale if isinstance(scale, int) else self.index(*scale)
+
+    def distance(self, a, b, metric=DEFAULT_METRIC):
+        """
+        Valor de 'metric' entre dos escalas (índices o tuplas (raíz, modo[, variación])).
+        """
+        return self._row(metric)[self._resolve(a) * len(self) + self._resolve(b)]
+
+    def _candidates(self, modes):
+        if modes is None:
+            return range(len(self))
+        keys = [k for k, (mode, _) in enumerate(self.keys) if mode in modes]
+        return [root * len(self.keys) + k for root in range(12) for k in keys]
+
+    def nearest(self, root_note, mode, variation=None, k=5, metric=DEFAULT_METRIC, modes=None,
+                distinct=True):
+        """
+        Las 'k' escalas más cercanas a (root_note, mode, variation), como
+        Neighbor de menor a mayor distancia ("common_tones": de más a menos
+        notas en común). Con 'distinct' se omiten las escalas con las mismas
+        notas (p.ej. los otros modos de la misma mayor); 'modes' limita los
+        candidatos a esos modos.
+        """
+        matrix = self._row(metric)
+        origin = self.index(root_note, mode, variation)
+        start = origin * len(self)
+        same_notes = self.hamming
+        sign = -1 if metric == "common_tones" else 1
+
+        candidates = (
+            i for i in self._candidates(modes)
+            if i != origin and not (distinct and same_notes[start + i] == 0)
+        )
+        best = heapq.nsmallest(k, candidates, key=lambda i: sign * matrix[start + i])
+        names = self._caller_names((root_note,))
+        return [Neighbor(*self.scale(i, names), matrix[start + i]) for i in best]
+
+    def _adjacency(self, metric, max_step):
+        # Por escala, (vecina, distancia) de las que están a <= max_step; se guarda por (métrica, paso)
+        key = (metric, max_step)
+        adjacency = self._adjacencies.get(key)
+        if adjacency is None:
+            matrix, size = self._row(metric), len(self)
+            adjacency = self._adjacencies[key] = tuple(
+                tuple((j, step) for j, step in enumerate(matrix[i * size:(i + 1) * size])
+                      if step <= max_step and j != i)
+                for i in range(size)
+            )
+        return adjacency
+
+    def modulation_path(self, origin, target, max_step=2, metric=DEFAULT_METRIC, modes=None):
+        """
+        Camino de menor coste (suma de 'metric' de cada paso) de 'origin' a
+        'target' (tuplas (raíz, modo[, variación])) pasando por escalas a
+        distancia <= max_step entre sí; a igual coste, el de menos pasos.
+        'modes' limita las escalas intermedias. Devuelve la lista de Scale
+        (incluidos los extremos) o None si no hay camino.
+        """
+        if metric == "common_tones":
+            raise ValueError("modulation_path necesita una distancia: 'voice_leading' o 'hamming'")
+        matrix = self._row(metric)
+        start, goal = self._resolve(origin), self._resolve(target)
+        allowed = None if modes is None else set(self._candidates(modes)) | {start, goal}
+        adjacency = self._adjacency(metric, max_step)
+
+        best = {start: (0, 0)}
+        previous = {}
+        heap = [(0, 0, start)]
+        while heap:
+            cost, steps, i = heapq.heappop(heap)
+            if i == goal:
+                break
+            if best[i] < (cost, steps):
+                continue
+            for j, step in adjacency[i]:
+                if allowed is not None and j not in allowed or step == 0 and j != goal:
+                    continue
+                candidate = (cost + step, steps + 1)
+                if candidate < best.get(j, (float("inf"), 0)):
+                    best[j] = candidate
+                    previous[j] = i
+                    heapq.heappush(heap, (*candidate, j))
+        if goal not in best:
+            return None
+
+        path = [goal]
+        while path[-1] != start:
+            path.append(previous[path[-1]])
+        names = self._caller_names(origin, target)
+        return [self.scale(i, names) for i in reversed(path)]
+
+
+# ---------------------------------------------
+# MATRIZ COMPARTIDA (MEMORIA + DISCO)
+# ---------------------------------------------
+_shared = {"matrix": None}
+mode_registry.add_listener(lambda: _shared.update(matrix=None))
+
+
+def cache_path(cache_dir=None, registry=mode_registry):
+    """
+    Ruta del archivo de caché para el registro actual en 'cache_dir' (o
+    DEFAULT_CACHE_DIR); None si no hay directorio de caché.
+    """
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    if cache_dir is None:
+        return None
+    return os.path.join(cache_dir, f"similarity-{registry_fingerprint(registry).hex()}.bin")
+
+
+def similarity_matrix(cache_dir=None, use_disk=True):
+    """
+    La SimilarityMatrix del registro actual: en memoria si ya se pidió; si
+    no, con un directorio de caché ('cache_dir' o HOLYGRAIL_CACHE_DIR) se lee
+    del archivo o se construye y se guarda (si el directorio no se puede
+    escribir, solo queda en memoria). Sin directorio no se toca el disco.
+    """
+    matrix = _shared["matrix"]
+    if matrix is not None:
+        return matrix
+    path = cache_path(cache_dir)
+    use_disk = use_disk and path is not None
+    fingerprint = registry_fingerprint()
+    if use_disk and os.path.exists(path):
+        try:
+            matrix = SimilarityMatrix.load(path)
+        except (OSError, ValueError, struct.error):
+            matrix = None
+        if matrix is not None and matrix.fingerprint != fingerprint:
+            matrix = None
+    if matrix is None:
+        matrix = SimilarityMatrix.build()
+        if use_disk:
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                matrix.save(path)
+            except OSError:
+                pass
+    _shared["matrix"] = matrix
+    return matrix
+
+
+def nearest_scales(root_note, mode="Ionian", variation=None, k=5, metric=DEFAULT_METRIC, modes=None,
+                   distinct=True):
+    """
+    Atajo de similarity_matrix().nearest(...).
+    """
+    return similarity_matrix().nearest(root_note, mode, variation, k, metric, modes, distinct)
+
+
+def modulation_path(origin, target, max_step=2, metric=DEFAULT_METRIC, modes=None):
+    """
+    Atajo de similarity_matrix().modulation_path(...).
+    """
+    return similarity_matrix().modulation_path(origin, target, max_step, metric, modes)
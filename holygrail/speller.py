@@ -0,0 +1,42 @@
+"""
+Enarmonización aritmética: la letra de cada nota sale del grado y la alteración
+de la diferencia en semitonos con la nota natural de esa letra. No hay búsqueda
+de candidatos ni comparación de cadenas, y sirve para cualquier tónica
+(G# Ionian → G# A# B# C# D# E# F##).
+"""
+from .note_parser import LETTERS, NATURAL_PITCH_CLASSES, parse_note, spelling_code
+
+# Clase de altura natural de cada letra, por índice en LETTERS
+_NATURAL_BY_INDEX = tuple(NATURAL_PITCH_CLASSES[letter] for letter in LETTERS)
+
+
+def spell_code(letter_index, root_index, interval, degree):
+    """
+    Código de enarmonía (note_parser.spelling_code) del intervalo 'interval'
+    sobre la raíz, escrito con la letra del grado 'degree' (1-7).
+    """
+    target_index = (letter_index + degree - 1) % 7
+    accidental = (root_index + interval - _NATURAL_BY_INDEX[target_index] + 6) % 12 - 6
+    return target_index << 4 | (accidental + 8)
+
+
+def spell_interval(root_note, interval, degree):
+    """
+    Código de enarmonía de la nota a 'interval' semitonos de 'root_note',
+    escrita con la letra del grado 'degree'.
+    """
+    root = parse_note(root_note)
+    return spell_code(LETTERS.index(root.letter), root.pitch_class, interval, degree)
+
+
+def spell_scale_codes(root_note, compiled):
+    """
+    Códigos de enarmonía de todas las notas de 'compiled' (CompiledMode) desde 'root_note'.
+    """
+    root = parse_note(root_note)
+    root_code = spelling_code(root)  # la raíz se conserva tal como se escribió
+    letter_index = LETTERS.index(root.letter)
+    return tuple(
+        root_code if interval == 0 else spell_code(letter_index, root.pitch_class, interval, degree)
+        for interval, degree in zip(compiled.intervals, compiled.degrees)
+    )
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Los tests importan 'holygrail' y los scripts HolyGrail*.py desde la raíz del repositorio
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
@@ -0,0 +1,23 @@
+import holygrail
+from holygrail.key_signature import BATCH_PAD
+
+
+def test_batch_rows_match_single_scales():
+    queries = [("G", "Aeolian", None), ("Bb", "Mixolydian", "sus4"), ("G", "Aeolian", None), ("f#", "Altered", None)]
+    batch = holygrail.calculate_scales_batch(*zip(*queries))
+    width = batch["width"]
+    assert batch["size"] == len(queries)
+    for row, (root_note, mode, variation) in enumerate(queries):
+        result = holygrail.calculate_major_scale(root_note, mode, variation=variation)
+        n = batch["lengths"][row]
+        spellings = batch["spellings"][row * width:(row + 1) * width]
+        assert tuple(spellings[:n]) == result.spelling_codes
+        assert set(spellings[n:]) <= {BATCH_PAD}
+        assert tuple(batch["roles"][row * width:row * width + n]) == result.role_codes
+        assert batch["root_scales"][row] == result.root_scale_code
+
+
+def test_single_mode_batch():
+    batch = holygrail.calculate_scales_batch(["C", "D"], "Dorian")
+    assert list(batch["lengths"]) == [7, 7]
+    assert holygrail.calculate_scales_batch([], "Dorian")["size"] == 0
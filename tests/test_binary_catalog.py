@@ -0,0 +1,56 @@
+import pytest
+
+import holygrail
+from holygrail.binary_catalog import HEADER, BinaryCatalog, write_binary_catalog
+
+
+@pytest.fixture(scope="module")
+def catalog_path(tmp_path_factory):
+    return write_binary_catalog(str(tmp_path_factory.mktemp("catalogo") / "catalogo.bin"))
+
+
+def test_get_matches_engine(catalog_path):
+    with BinaryCatalog(catalog_path) as catalog:
+        for root_note, mode, variation, result in holygrail.iter_all_scales(roots=["C", "Bb", "F#"]):
+            assert catalog.get(root_note, mode, variation) == result
+
+
+def test_roles_decoded_with_file_table(catalog_path, tmp_path):
+    # Mismo catálogo con los roles "Permitido" y "Evitado" intercambiados en el archivo
+    data = bytearray(open(catalog_path, "rb").read())
+    header = HEADER.unpack_from(data)
+    strings_size, strings_start, roles_start = header[6], header[7], header[-1]
+    strings = bytes(data[strings_start:strings_start + strings_size])
+    data[strings_start:strings_start + strings_size] = strings.replace(
+        b"\0Permitido\0Evitado\0", b"\0Evitado\0Permitido\0")
+    # La sección de roles es la última del archivo
+    data[roles_start:] = data[roles_start:].translate(bytes([1, 0]) + bytes(range(2, 256)))
+    swapped = tmp_path / "swapped.bin"
+    swapped.write_bytes(bytes(data))
+
+    with BinaryCatalog(str(swapped)) as catalog:
+        assert catalog.role_names[:2] == ("Evitado", "Permitido")
+        assert catalog.get("G", "Aeolian") == holygrail.calculate_major_scale("G", "Aeolian")
+
+
+def test_close_with_live_view(catalog_path):
+    catalog = BinaryCatalog(catalog_path)
+    view = catalog.view("G", "Aeolian")
+    catalog.close()
+    assert bytes(view.intervals) == bytes(holygrail.calculate_major_scale("G", "Aeolian").interval_codes)
+    catalog.close()
+
+
+@pytest.mark.parametrize("spelling", ["key_signature", "greedy"])
+def test_relative_major_matches_get_relative_major(tmp_path, spelling):
+    path = write_binary_catalog(str(tmp_path / f"{spelling}.bin"), spelling=spelling)
+    with BinaryCatalog(path) as catalog:
+        for root_note in catalog.roots:
+            for mode, variation in catalog.keys:
+                try:
+                    expected = holygrail.get_relative_major(root_note, mode)
+                except ValueError:
+                    with pytest.raises(ValueError):
+                        catalog.relative_major(root_note, mode)
+                else:
+                    assert catalog.relative_major(root_note, mode) == expected
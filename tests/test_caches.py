@@ -0,0 +1,44 @@
+import copy
+
+import pytest
+
+import holygrail
+from holygrail import greedy, key_signature
+from holygrail.mode_registry import mode_registry
+
+
+@pytest.fixture
+def redefined_ionian():
+    # Ionian sin nota evitada; se restaura la definición original al terminar
+    original = copy.deepcopy(mode_registry.definitions["Ionian"])
+    changed = copy.deepcopy(original)
+    changed["roles"][5] = "Permitido"
+    mode_registry.update({"Ionian": changed})
+    yield
+    mode_registry.update({"Ionian": original})
+
+
+@pytest.mark.parametrize("engine", [key_signature, greedy])
+def test_registry_update_invalidates_catalog(engine, redefined_ionian):
+    assert "Evitado" not in engine.calculate_major_scale("C", "Ionian")["roles"]
+
+
+def test_enable_cache_bounds_every_engine():
+    holygrail.enable_cache(4)
+    try:
+        for root_note in ("C#", "C##", "C###", "C####", "C#####", "C######"):
+            greedy.calculate_major_scale(root_note, "Ionian")
+        assert len(greedy._scale_catalog) == 4
+        assert "greedy.calculate_major_scale" in holygrail.cache_stats()
+    finally:
+        holygrail.disable_cache()
+
+
+def test_degree_tables_shared_by_the_modes_of_a_key():
+    key_signature.invalidate_caches()
+    aeolian = key_signature.calculate_modes_for_degrees("G", "Aeolian")
+    dorian = key_signature.calculate_modes_for_degrees("C", "Dorian")
+    assert aeolian == dorian and aeolian is not dorian
+    assert list(aeolian) == ["Ionian", "Dorian", "Phrygian", "Lydian", "Mixolydian", "Aeolian", "Locrian"]
+    assert aeolian["Aeolian"]["notes"] == ("G", "A", "Bb", "C", "D", "Eb", "F")
+    assert key_signature.cache_stats()["calculate_modes_for_degrees"]["size"] == 1
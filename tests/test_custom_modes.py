@@ -0,0 +1,55 @@
+"""
+Modos añadidos desde un archivo de definiciones (sin mayor relativa ni
+familia). Se ejecutan en un proceso aparte para no tocar el registro global
+del resto de los tests.
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import REPO_ROOT
+
+BEBOP = {
+    "Bebop": {
+        "pattern": [2, 2, 1, 2, 2, 1, 1, 1],
+        "roles": {"0": "Permitido", "2": "Permitido", "4": "Permitido", "5": "Evitado",
+                  "7": "Permitido", "9": "Permitido", "10": "Permitido", "11": "Permitido"},
+    }
+}
+
+
+@pytest.fixture
+def extra_definitions(tmp_path):
+    path = tmp_path / "extra.json"
+    path.write_text(json.dumps(BEBOP), encoding="utf-8")
+    return str(path)
+
+
+def _run_catalog(*args):
+    return subprocess.run(
+        [sys.executable, os.path.join(REPO_ROOT, "HolyGrailCatalog.py"), *args],
+        capture_output=True, text=True, cwd=REPO_ROOT, check=True,
+    )
+
+
+@pytest.mark.parametrize("spelling", ["key_signature", "greedy"])
+def test_catalog_with_extra_definitions(extra_definitions, tmp_path, spelling):
+    output = tmp_path / "catalogo.jsonl"
+    _run_catalog("--definitions", extra_definitions, "--workers", "1", "--spelling", spelling, "-o", str(output))
+
+    entries = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    bebop = [entry for entry in entries if entry.get("mode") == "Bebop"]
+    assert len(bebop) == 36  # una por enarmonía de chromatic_scale
+    for entry in bebop:
+        assert len(entry["notes"]) == 8
+        # Sin mayor relativa ni escala padre, la "root scale" es la propia raíz
+        assert entry["root_scale"] == entry["root"]
+
+
+def test_binary_catalog_with_extra_definitions(extra_definitions, tmp_path):
+    path = tmp_path / "catalogo.bin"
+    _run_catalog("--definitions", extra_definitions, "--binary", str(path))
+    assert path.stat().st_size > 0
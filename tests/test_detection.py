@@ -0,0 +1,59 @@
+import pytest
+
+import holygrail
+from holygrail.detection import KeyDetector, note_pitch_class, parse_note_tokens, read_midi_notes
+
+
+def test_detects_d_dorian_from_its_notes():
+    detector = KeyDetector()
+    for note in holygrail.calculate_major_scale("D", "Dorian")["notes"] + ("D", "A", "D"):
+        detector.push(note)
+    best = detector.best()[0]
+    assert (best.root, best.mode) == ("D", "Dorian")
+    assert best.score == pytest.approx((10 + 0.5 * 3) / (10 * 1.5))
+
+
+def test_window_forgets_old_notes():
+    detector = KeyDetector(window=8)
+    for note in ["C", "E", "G", "C", "D", "F", "A", "B"] * 2 + ["Eb", "G", "Bb", "Eb", "Ab", "C", "D", "Eb"]:
+        detector.push(note)
+    assert len(detector) == 8
+    assert detector.best()[0][:2] == ("Eb", "Ionian")
+
+
+def test_note_tokens_and_pitch_classes():
+    assert list(parse_note_tokens("C4, Eb | 67")) == ["C4", "Eb", 67]
+    assert [note_pitch_class(note) for note in ("C4", "Eb", 67, "F##-1")] == [0, 3, 7, 7]
+    with pytest.raises(ValueError):
+        note_pitch_class("H2")
+
+
+def _track(*events):
+    data = b"".join(events)
+    return b"MTrk" + len(data).to_bytes(4, "big") + data
+
+
+def test_read_midi_notes(tmp_path):
+    melody = _track(
+        b"\x00\xff\x51\x03\x07\xa1\x20",   # tempo (meta evento)
+        b"\x00\x90\x3e\x64",               # D4 note-on
+        b"\x10\x40\x64",                   # E4 con running status
+        b"\x10\x3e\x00",                   # note-off de D4 (running status, velocidad 0)
+        b"\x00\x40\x00",                   # note-off de E4
+        b"\x00\xff\x2f\x00",               # fin de pista
+    )
+    drums = _track(
+        b"\x08\x99\x24\x64",               # bombo en el canal 10
+        b"\x00\x90\x45\x64",               # A4 en el canal 1, a la vez que el bombo
+        b"\x00\xff\x2f\x00",
+    )
+    header = b"MThd" + (6).to_bytes(4, "big") + b"\x00\x01\x00\x02\x00\x60"
+    path = tmp_path / "tema.mid"
+    path.write_bytes(header + melody + drums)
+
+    assert read_midi_notes(str(path)) == [62, 69, 64]
+    assert read_midi_notes(str(path), skip_percussion=False) == [62, 36, 69, 64]
+
+    (tmp_path / "roto.mid").write_bytes(header + melody[:-6])
+    with pytest.raises(ValueError):
+        read_midi_notes(str(tmp_path / "roto.mid"))
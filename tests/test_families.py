@@ -0,0 +1,36 @@
+import pytest
+
+import holygrail
+from holygrail.mode_registry import mode_registry
+
+
+def test_family_modes_in_registry_queries():
+    assert "Melodic minor" in mode_registry.families
+    exact = holygrail.find_exact_scales(["C", "D", "Eb", "F", "G", "A", "B"])
+    assert ("C", "Melodic minor", None) in exact
+    assert ("G", "Altered", None) in holygrail.find_scales_containing(["G", "Ab", "Bb", "B", "Db", "Eb", "F"])
+
+
+def test_family_root_scale_is_parent_root():
+    assert holygrail.calculate_major_scale("G", "Altered")["root_scale"] == "Ab"
+
+
+def test_interchange_includes_family_modes():
+    borrowed = [(s.mode, s.variation) for s in holygrail.borrowed_scales("C", "Fm7")]
+    assert borrowed[:2] == [("Harmonic minor", None), ("Whole-half diminished", None)]
+    assert ("Aeolian", None) in borrowed
+
+
+def test_symmetric_family_spellings():
+    # #4/#5 en tonos enteros: el #5 de Eb+ es B, no Cb
+    assert holygrail.calculate_major_scale("Eb", "Whole tone")["notes"] == ("Eb", "F", "G", "A", "B", "Db")
+    chord = holygrail.analyze_progression("Eb7#5")[0]
+    assert chord.scale["notes"][4] == "B"
+
+
+def test_declared_family_degrees_are_validated():
+    from holygrail.mode_registry import expand_family
+    modes = expand_family("Test", {"pattern": [2, 2, 2, 2, 2, 2], "degrees": {"Test 1": [1, 2, 3, 4, 5, 7]}})
+    assert modes["Test 1"]["degrees"] == [1, 2, 3, 4, 5, 7]
+    with pytest.raises(ValueError):
+        expand_family("Test", {"pattern": [2, 2, 2, 2, 2, 2], "degrees": {"Test 1": [1, 2, 3]}})
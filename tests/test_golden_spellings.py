@@ -0,0 +1,53 @@
+"""
+Salida de referencia de ambos motores sobre iter_all_scales(): notas y
+"root scale" de cada raíz × modo × variación. Cualquier cambio de
+enarmonización aparece aquí como diferencia de líneas.
+
+Para aceptar un cambio intencionado:
+  HOLYGRAIL_UPDATE_GOLDEN=1 python -m pytest tests/test_golden_spellings.py
+"""
+import os
+
+import pytest
+
+from holygrail import get_engine, iter_all_scales
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+
+
+def render_spellings(spelling):
+    engine = get_engine(spelling)
+    lines = []
+    for root_note, mode, variation, _ in iter_all_scales():
+        result = engine.calculate_major_scale(root_note, mode, variation=variation)
+        lines.append("\t".join([root_note, mode, variation or "-", " ".join(result["notes"]), result["root_scale"]]))
+    # Ordenadas: el orden del registro no forma parte de la salida de referencia
+    return sorted(lines)
+
+
+@pytest.mark.parametrize("spelling", ["key_signature", "greedy"])
+def test_golden_spellings(spelling):
+    path = os.path.join(GOLDEN_DIR, f"{spelling}.tsv")
+    actual = render_spellings(spelling)
+    if os.environ.get("HOLYGRAIL_UPDATE_GOLDEN"):
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            f.write("\n".join(actual) + "\n")
+    with open(path, encoding="utf-8") as f:
+        expected = f.read().splitlines()
+    assert actual == expected
+
+
+@pytest.mark.parametrize("spelling, root_note, mode, variation, notes", [
+    ("key_signature", "C", "Mixolydian", "7(b9,#9,b13)", ("C", "Db", "D#", "E", "F", "G", "Ab", "Bb")),
+    ("key_signature", "B#", "Ionian", None, ("B#", "C##", "D##", "E#", "F##", "G##", "A##")),
+    ("key_signature", "G", "Aeolian", None, ("G", "A", "Bb", "C", "D", "Eb", "F")),
+    ("greedy", "G", "Aeolian", None, ("G", "A", "Bb", "C", "D", "Eb", "F")),
+    ("key_signature", "C", "Whole tone", None, ("C", "D", "E", "F#", "G#", "Bb")),
+    ("key_signature", "Eb", "Whole tone", None, ("Eb", "F", "G", "A", "B", "Db")),
+    ("key_signature", "C", "Augmented", None, ("C", "D#", "E", "G", "G#", "B")),
+    ("key_signature", "C", "Augmented inverse", None, ("C", "Db", "E", "F", "G#", "A")),
+    ("key_signature", "C", "Whole-half diminished", None, ("C", "D", "Eb", "F", "Gb", "Ab", "A", "B")),
+    ("key_signature", "C", "Half-whole diminished", None, ("C", "Db", "D#", "E", "F#", "G", "A", "Bb")),
+])
+def test_known_spellings(spelling, root_note, mode, variation, notes):
+    assert get_engine(spelling).calculate_major_scale(root_note, mode, variation=variation)["notes"] == notes
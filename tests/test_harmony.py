@@ -0,0 +1,28 @@
+import pytest
+
+import holygrail
+from holygrail.harmony import DEGREE_MODES, diatonic_chords
+from holygrail.key_signature import chromatic_scale
+
+
+def test_g_sharp_ionian_keeps_the_tonic_spelling():
+    chords = diatonic_chords("G#", "Ionian")
+    assert chords[0].root == "G#" and chords[0].symbol == "G#maj7"
+    assert [c.symbol for c in chords] == ["G#maj7", "A#m7", "B#m7", "C#maj7", "D#7", "E#m7", "F##m7b5"]
+
+
+@pytest.mark.parametrize("mode", DEGREE_MODES)
+def test_degree_roots_follow_calculate_major_scale(mode):
+    for names in chromatic_scale:
+        for root_note in names:
+            chords = diatonic_chords(root_note, mode)
+            assert tuple(c.root for c in chords) == holygrail.calculate_major_scale(root_note, mode)["notes"]
+            assert chords[0].mode == mode
+            assert chords[0].chord_scale == holygrail.calculate_major_scale(root_note, mode)
+
+
+def test_lydian_and_aeolian_keys():
+    assert [c.symbol for c in diatonic_chords("C", "Lydian")] == \
+        ["Cmaj7", "D7", "Em7", "F#m7b5", "Gmaj7", "Am7", "Bm7"]
+    assert [c.symbol for c in diatonic_chords("G", "Aeolian")] == \
+        ["Gm7", "Am7b5", "Bbmaj7", "Cm7", "Dm7", "Ebmaj7", "F7"]
@@ -0,0 +1,52 @@
+import pytest
+
+from holygrail import instrumentation, key_signature
+
+
+@pytest.fixture
+def instrumented():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disable_restores_originals():
+    originals = {name: getattr(key_signature, name) for name in instrumentation.INSTRUMENTED["key_signature"]}
+    instrumentation.enable()
+    try:
+        assert instrumentation.is_enabled()
+        assert key_signature.calculate_major_scale is not originals["calculate_major_scale"]
+        assert key_signature.calculate_major_scale.__wrapped__ is originals["calculate_major_scale"]
+    finally:
+        instrumentation.disable()
+    assert not instrumentation.is_enabled()
+    assert {name: getattr(key_signature, name) for name in originals} == originals
+
+
+def test_snapshot_counts_calls(instrumented):
+    key_signature.invalidate_caches()
+    key_signature.calculate_major_scale("E", "Phrygian")
+    key_signature.calculate_major_scale("E", "Phrygian")
+    snapshot = instrumentation.snapshot()
+    assert snapshot["enabled"]
+    functions = snapshot["functions"]
+    assert functions["key_signature.calculate_major_scale"]["count"] == 2
+    assert functions["key_signature._build_major_scale"]["count"] == 1
+    assert snapshot["caches"]["calculate_major_scale"]["hits"] >= 1
+
+    instrumentation.reset()
+    assert instrumentation.snapshot()["functions"] == {}
+
+
+def test_prometheus_export(instrumented):
+    key_signature.calculate_major_scale("A", "Dorian")
+    text = instrumentation.to_prometheus()
+    assert text.endswith("\n")
+    assert "# TYPE holygrail_calls_total counter" in text
+    assert 'holygrail_calls_total{function="key_signature.calculate_major_scale"} 1' in text
+    assert 'holygrail_call_seconds{function="key_signature.calculate_major_scale",quantile="0.99"}' in text
+    assert 'holygrail_cache_size{cache="calculate_major_scale"}' in text
+    for line in text.splitlines():
+        assert line.startswith("#") or len(line.rsplit(" ", 1)) == 2
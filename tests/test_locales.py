@@ -0,0 +1,34 @@
+import pytest
+
+import holygrail
+from holygrail.mode_registry import ROLE_NAMES, mode_registry
+from holygrail.names import _tables, available_locales, name_table
+
+
+@pytest.mark.parametrize("locale", available_locales())
+def test_every_role_is_translated(locale):
+    roles = name_table(locale).roles
+    assert set(ROLE_NAMES) <= set(roles)
+    for compiled in mode_registry:
+        assert set(compiled.roles) <= set(roles), (compiled.mode, compiled.variation)
+
+
+@pytest.mark.parametrize("locale", available_locales())
+def test_every_interval_is_named(locale):
+    table = name_table(locale)
+    assert table.unknown not in table.intervals
+
+
+def test_rendered_roles_are_localized():
+    result = holygrail.calculate_major_scale("G", "Mixolydian", variation="7(b9,b13)")
+    assert "Permitido (Excluyente)" in result["roles"]
+    assert not set(result.to_dict("en")["roles"]) & set(ROLE_NAMES)
+
+
+@pytest.mark.parametrize("alias", ["./en", "../locales/en", "en/../en", "EN", "", None, "../../etc/passwd"])
+def test_locale_aliases_are_rejected(alias):
+    before = set(_tables)
+    with pytest.raises(ValueError):
+        name_table(alias)
+    assert set(_tables) == before
+    assert set(_tables) <= set(available_locales())
@@ -0,0 +1,36 @@
+import pytest
+
+import holygrail
+from holygrail.midi import MAX_OCTAVES, MIDI_MAX
+
+
+def test_octaves_cover_the_midi_range():
+    pitches = holygrail.calculate_major_scale(0, "Ionian", octaves=MAX_OCTAVES)
+    assert pitches[0] == 0 and pitches[-1] == MIDI_MAX
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"root_note": 60, "octaves": 0},
+    {"root_note": 60, "octaves": MAX_OCTAVES + 1},
+    {"root_note": 60, "octaves": True},
+    {"root_note": 60, "register": 3},
+    {"root_note": True},
+    {"root_note": "C", "register": True},
+])
+def test_invalid_midi_arguments(kwargs):
+    with pytest.raises(ValueError):
+        holygrail.calculate_major_scale(mode="Ionian", **kwargs)
+
+
+@pytest.mark.parametrize("mode", ["Phrygian", "Aeolian", "Locrian"])
+def test_degree_roots_stay_in_range_and_order(mode):
+    modes = holygrail.calculate_modes_for_degrees(0, mode)
+    roots = [pitches[0] for pitches in modes.values()]
+    assert roots == sorted(roots) and roots[0] >= 0
+    # Toda la tabla sube una octava: la tónica pedida queda en 12
+    assert modes[mode][0] == 12
+
+
+def test_degree_table_keeps_register_when_in_range():
+    modes = holygrail.calculate_modes_for_degrees(60, "Locrian")
+    assert modes["Locrian"][0] == 60 and modes["Ionian"][0] == 49
@@ -0,0 +1,42 @@
+import pytest
+
+from holygrail.mode_registry import interval_mask, mode_registry
+from holygrail.harmony import chord_mask
+from holygrail.progression import CHORD_QUALITIES, analyze_progression, parse_chord_symbol
+
+
+@pytest.mark.parametrize("suffix", sorted(CHORD_QUALITIES))
+def test_chord_scale_contains_chord(suffix):
+    chord_intervals, mode, variation = CHORD_QUALITIES[suffix]
+    assert mode_registry.has_variation(mode, variation)
+    assert mode_registry.is_subset(interval_mask(chord_intervals), mode, variation)
+
+
+def test_lead_sheet_symbols():
+    chords = analyze_progression("Cdim C° Caug C7#9 Cm(maj7) | Bdim7", key="C")
+    assert [(c.mode, c.variation) for c in chords] == [
+        ("Locrian", None), ("Locrian", None), ("Whole tone", None),
+        ("Mixolydian", "7(b9,#9,b13)"), ("Melodic minor", None), ("Whole-half diminished", None),
+    ]
+
+
+def test_unknown_chord_errors():
+    with pytest.raises(ValueError):
+        analyze_progression("Dm7 Xq7 Cmaj7")
+    chords = analyze_progression("Dm7 Xq7 Cmaj7", errors="keep")
+    assert [c.mode for c in chords] == ["Dorian", None, "Ionian"]
+    assert chords[1].symbol == "Xq7" and "Xq7" in chords[1].error
+
+
+@pytest.mark.parametrize("symbol, suffix", [
+    ("C6/9", "6/9"), ("C6/E", "6"), ("C6/9/E", "6/9"), ("C7/Bb", "7"), ("Cm7", "m7"),
+])
+def test_slash_chords(symbol, suffix):
+    assert parse_chord_symbol(symbol)[1] == suffix
+
+
+def test_six_nine_keeps_the_ninth():
+    assert chord_mask("C6/9") == interval_mask((0, 2, 4, 7, 9))
+    assert chord_mask("C6/E") == interval_mask((0, 4, 7, 9))
+    with pytest.raises(ValueError):
+        parse_chord_symbol("C6/X")
@@ -0,0 +1,38 @@
+import pickle
+
+import pytest
+
+import holygrail
+from holygrail.scale_result import RESULT_KEYS, ScaleResult
+
+
+@pytest.fixture
+def result():
+    return holygrail.calculate_major_scale("G", "Aeolian")
+
+
+def test_mapping_protocol(result):
+    assert list(result) == list(RESULT_KEYS)
+    assert len(result) == 4
+    assert "notes" in result and "mask" not in result
+    assert result.get("root_scale") == "Bb"
+    assert result.get("mask", 0) == 0
+    assert dict(result.items()) == dict(result) == result.to_dict()
+    with pytest.raises(KeyError):
+        result["mask"]
+
+
+def test_equality_and_hash(result):
+    same = ScaleResult(result.to_bytes())
+    assert same == result and hash(same) == hash(result)
+    assert result != result.to_bytes()
+    assert result == dict(result)
+    assert pickle.loads(pickle.dumps(result)) == result
+
+
+def test_equal_to_legacy_dict_of_lists(result):
+    legacy = {key: list(value) if isinstance(value, tuple) else value for key, value in result.items()}
+    assert result == legacy and legacy == result
+    assert result != {**legacy, "notes": legacy["notes"][::-1]}
+    assert result != {**legacy, "extra": 1}
+    assert result != {key: legacy[key] for key in ("notes", "intervals", "roles")}
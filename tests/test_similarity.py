@@ -0,0 +1,62 @@
+import pytest
+
+from holygrail import similarity
+from holygrail.mode_registry import interval_mask
+from holygrail.similarity import SimilarityMatrix, voice_leading_distance
+
+
+@pytest.fixture(scope="module")
+def matrix():
+    return SimilarityMatrix.build()
+
+
+def test_voice_leading_distance():
+    c_major = interval_mask((0, 2, 4, 5, 7, 9, 11))
+    g_major = interval_mask((7, 9, 11, 0, 2, 4, 6))
+    assert voice_leading_distance(c_major, c_major) == 0
+    assert voice_leading_distance(c_major, g_major) == 1
+
+
+def test_nearest_scales(matrix):
+    neighbors = matrix.nearest("C", "Ionian", k=3)
+    assert [(n.root, n.mode, n.distance) for n in neighbors][:2] == [("C", "Lydian", 1), ("C", "Mixolydian", 1)]
+    # distinct: nunca devuelve otro modo de la misma mayor (mismas notas)
+    assert all(n.distance > 0 for n in matrix.nearest("D", "Dorian", k=20, modes={"Ionian", "Aeolian"}))
+    assert matrix.nearest("Db", "Ionian", k=1, modes={"Lydian"})[0].root == "Db"
+
+
+def test_modulation_path_by_fifths(matrix):
+    path = matrix.modulation_path(("C", "Ionian"), ("Eb", "Ionian"), max_step=1, modes={"Ionian"})
+    assert [(s.root, s.mode) for s in path] == [("C", "Ionian"), ("F", "Ionian"), ("Bb", "Ionian"), ("Eb", "Ionian")]
+    with pytest.raises(ValueError):
+        matrix.modulation_path(("C", "Ionian"), ("G", "Ionian"), metric="common_tones")
+
+
+def test_path_echoes_caller_spelling(matrix):
+    path = matrix.modulation_path(("Db", "Ionian"), ("Gb", "Ionian"), max_step=1, modes={"Ionian"})
+    assert [s.root for s in path] == ["Db", "Gb"]
+    assert matrix.modulation_path(("C#", "Ionian"), ("F#", "Ionian"), max_step=1, modes={"Ionian"})[0].root == "C#"
+
+
+def test_matrix_round_trip(matrix, tmp_path):
+    loaded = SimilarityMatrix.load(matrix.save(str(tmp_path / "matriz.bin")))
+    assert loaded.keys == matrix.keys and loaded.fingerprint == matrix.fingerprint
+    assert loaded.voice_leading == matrix.voice_leading and loaded.hamming == matrix.hamming
+
+
+def test_disk_cache_is_opt_in(matrix, monkeypatch, tmp_path):
+    def fail(self, path):
+        raise AssertionError(f"escritura inesperada en {path}")
+
+    monkeypatch.setattr(similarity, "DEFAULT_CACHE_DIR", None)
+    monkeypatch.setitem(similarity._shared, "matrix", None)
+    monkeypatch.setattr(SimilarityMatrix, "build", classmethod(lambda cls, registry=None: matrix))
+    assert similarity.cache_path() is None
+    monkeypatch.setattr(SimilarityMatrix, "save", fail)
+    assert similarity.similarity_matrix() is matrix
+
+    monkeypatch.undo()
+    monkeypatch.setitem(similarity._shared, "matrix", None)
+    monkeypatch.setattr(SimilarityMatrix, "build", classmethod(lambda cls, registry=None: matrix))
+    similarity.similarity_matrix(str(tmp_path))
+    assert list(tmp_path.iterdir()) == [tmp_path / f"similarity-{matrix.fingerprint.hex()}.bin"]